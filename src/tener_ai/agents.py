@@ -4,11 +4,11 @@ import inspect
 import json
 import re
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from .language import resolve_conversation_language, resolve_outbound_language
 from .message_extraction import classify_faq_intent
+from .config_cache import load_json_config
 from .matching import MatchingEngine
 
 
@@ -838,8 +838,7 @@ class OutreachAgent:
 
     @staticmethod
     def _load_templates(path: str) -> Dict[str, Any]:
-        with Path(path).open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_config(path)
 
 
 class FAQAgent:
@@ -882,5 +881,4 @@ class FAQAgent:
 
     @staticmethod
     def _load_templates(path: str) -> Dict[str, Any]:
-        with Path(path).open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_config(path)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import copy
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .config_cache import load_json_config
+
 
 DEFAULT_SCORING_POLICY: Dict[str, Any] = {
     "version": "default",
@@ -36,7 +38,7 @@ class CandidateScoringPolicy:
         self.payload = self._load(path)
 
     def reload(self) -> None:
-        self.payload = self._load(self.path)
+        self.payload = self._load(self.path, reload=True)
 
     def decorate_candidate_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         item = dict(row)
@@ -226,16 +228,15 @@ class CandidateScoringPolicy:
         return num
 
     @staticmethod
-    def _load(path: str | None) -> Dict[str, Any]:
+    def _load(path: str | None, *, reload: bool = False) -> Dict[str, Any]:
         if not path:
-            return dict(DEFAULT_SCORING_POLICY)
+            return copy.deepcopy(DEFAULT_SCORING_POLICY)
         file_path = Path(path)
         if not file_path.exists():
-            return dict(DEFAULT_SCORING_POLICY)
-        with file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+            return copy.deepcopy(DEFAULT_SCORING_POLICY)
+        data = load_json_config(file_path, reload=reload)
         if not isinstance(data, dict):
-            return dict(DEFAULT_SCORING_POLICY)
+            return copy.deepcopy(DEFAULT_SCORING_POLICY)
         return data
 
     @classmethod
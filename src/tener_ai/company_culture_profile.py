@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import heapq
 import html as html_utils
 import json
 import re
+import sys
+import threading
 import xml.etree.ElementTree as ET
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
 from urllib import error as urlerror, parse as urlparse, request as urlrequest
 
 
@@ -59,6 +64,10 @@ JOB_BOARD_PATH_MARKERS = (
     "/join-us",
 )
 
+JOB_BOARD_DOMAINS = frozenset(JOB_BOARD_DOMAIN_MARKERS)
+JOB_BOARD_PATH_RE = re.compile("|".join(re.escape(marker) for marker in JOB_BOARD_PATH_MARKERS))
+RSS_FEED_CHUNK_SIZE = 16 * 1024
+
 CANDIDATE_SIGNAL_KEYWORDS = {
     "ownership in ambiguous environments": ["ownership", "self-starter", "autonomous", "ambiguity"],
     "cross-functional collaboration": ["cross-functional", "stakeholder", "collaborat", "partner with"],
@@ -96,6 +105,19 @@ JOB_SENTENCE_KEYWORDS = (
     "nice to have",
 )
 
+# Brave embeds hydrated results as JS objects containing title:"...",url:"...".
+BRAVE_RESULT_PAIR_RE = re.compile(r'title:"((?:\\.|[^"\\]){1,600})",url:"(https?:\\/\\/(?:\\.|[^"\\])+?)"')
+DDG_RESULT_LINK_RE = re.compile(
+    r'<a[^>]+class="[^"]*result__a[^"]*"[^>]+href="([^"]+)"[^>]*>(.*?)</a>',
+    flags=re.IGNORECASE | re.DOTALL,
+)
+HTML_TAG_RE = re.compile(r"(?is)<[^>]+>")
+HTML_SCRIPT_RE = re.compile(r"(?is)<script[^>]*>.*?</script>")
+HTML_STYLE_RE = re.compile(r"(?is)<style[^>]*>.*?</style>")
+HTML_COMMENT_RE = re.compile(r"(?is)<!--.*?-->")
+NBSP_ENTITY_RE = re.compile(r"&nbsp;?")
+WHITESPACE_RE = re.compile(r"\s+")
+
 DEFAULT_CULTURE_ANALYSIS_RULES = """
 You are a senior organizational psychologist and culture analyst.
 
@@ -126,7 +148,11 @@ Write as if advising a candidate whether they truly fit this environment.
 """.strip()
 
 
-@dataclass
+# slots=True is only accepted by dataclass() from Python 3.10 on.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SearchResult:
     url: str
     title: str = ""
@@ -135,7 +161,7 @@ class SearchResult:
     query: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FetchResponse:
     url: str
     status_code: int
@@ -242,15 +268,11 @@ class BraveHtmlSearchProvider:
 
     @staticmethod
     def _parse_results_from_html(*, html: str, query: str, limit: int) -> List[SearchResult]:
-        # Brave embeds hydrated results as JS objects containing title:"...",url:"...".
-        pairs = re.findall(
-            r'title:"((?:\\.|[^"\\]){1,600})",url:"(https?:\\/\\/(?:\\.|[^"\\])+?)"',
-            html,
-        )
         seen: set[str] = set()
         out: List[SearchResult] = []
         rank = 0
-        for raw_title, raw_url in pairs:
+        for match in BRAVE_RESULT_PAIR_RE.finditer(html):
+            raw_title, raw_url = match.groups()
             title = BraveHtmlSearchProvider._decode_js_string(raw_title)
             url = BraveHtmlSearchProvider._decode_js_string(raw_url)
             canonical = canonicalize_url(url)
@@ -318,22 +340,19 @@ class DuckDuckGoHtmlSearchProvider:
 
     @staticmethod
     def _parse_results_from_html(*, html: str, query: str, limit: int) -> List[SearchResult]:
-        pattern = re.compile(
-            r'<a[^>]+class="[^"]*result__a[^"]*"[^>]+href="([^"]+)"[^>]*>(.*?)</a>',
-            flags=re.IGNORECASE | re.DOTALL,
-        )
         seen: set[str] = set()
         out: List[SearchResult] = []
         rank = 0
-        for href, raw_title in pattern.findall(str(html or "")):
+        for match in DDG_RESULT_LINK_RE.finditer(str(html or "")):
+            href, raw_title = match.groups()
             url = DuckDuckGoHtmlSearchProvider._extract_target_url(href)
             canonical = canonicalize_url(url)
             if not canonical or canonical in seen:
                 continue
             seen.add(canonical)
             rank += 1
-            title = re.sub(r"(?is)<[^>]+>", " ", raw_title)
-            title = html_utils.unescape(re.sub(r"\s+", " ", title)).strip()
+            title = HTML_TAG_RE.sub(" ", raw_title)
+            title = html_utils.unescape(WHITESPACE_RE.sub(" ", title)).strip()
             out.append(
                 SearchResult(
                     url=canonical,
@@ -404,42 +423,50 @@ class BingRssSearchProvider:
             },
         )
         with urlrequest.urlopen(req, timeout=self.timeout_seconds) as response:
-            xml_text = response.read().decode("utf-8", errors="replace")
-        return self._parse_results_from_rss(rss_xml=xml_text, query=normalized_query, limit=limit)
+            # Raw bytes let expat honour the feed's declared encoding.
+            xml_bytes = response.read()
+        return self._parse_results_from_rss(rss_xml=xml_bytes, query=normalized_query, limit=limit)
 
     @staticmethod
-    def _parse_results_from_rss(*, rss_xml: str, query: str, limit: int) -> List[SearchResult]:
-        try:
-            root = ET.fromstring(str(rss_xml or ""))
-        except ET.ParseError:
-            return []
-
+    def _iter_rss_items(rss_xml: bytes | str) -> Iterator[ET.Element]:
+        # Feed the document in chunks so callers can stop at `limit` before the rest is parsed.
+        parser = ET.XMLPullParser(events=("end",))
+        for start in range(0, len(rss_xml), RSS_FEED_CHUNK_SIZE):
+            parser.feed(rss_xml[start : start + RSS_FEED_CHUNK_SIZE])
+            yield from (element for _, element in parser.read_events() if element.tag == "item")
+        parser.close()
+        yield from (element for _, element in parser.read_events() if element.tag == "item")
+
+    @classmethod
+    def _parse_results_from_rss(cls, *, rss_xml: bytes | str, query: str, limit: int) -> List[SearchResult]:
         seen: set[str] = set()
         out: List[SearchResult] = []
         rank = 0
-        for item in root.findall(".//item"):
-            link_node = item.find("link")
-            title_node = item.find("title")
-            desc_node = item.find("description")
-            raw_link = str(link_node.text or "").strip() if link_node is not None else ""
-            canonical = canonicalize_url(raw_link)
-            if not canonical or canonical in seen:
-                continue
-            seen.add(canonical)
-            rank += 1
-            title = html_utils.unescape(str(title_node.text or "").strip()) if title_node is not None else ""
-            snippet = html_utils.unescape(str(desc_node.text or "").strip()) if desc_node is not None else ""
-            out.append(
-                SearchResult(
-                    url=canonical,
-                    title=title[:300],
-                    snippet=snippet[:400],
-                    rank=rank,
-                    query=query,
+        try:
+            for item in cls._iter_rss_items(rss_xml or b""):
+                raw_link = str(item.findtext("link") or "").strip()
+                title = html_utils.unescape(str(item.findtext("title") or "").strip())
+                snippet = html_utils.unescape(str(item.findtext("description") or "").strip())
+                item.clear()
+                canonical = canonicalize_url(raw_link)
+                if not canonical or canonical in seen:
+                    continue
+                seen.add(canonical)
+                rank += 1
+                out.append(
+                    SearchResult(
+                        url=canonical,
+                        title=title[:300],
+                        snippet=snippet[:400],
+                        rank=rank,
+                        query=query,
+                    )
                 )
-            )
-            if len(out) >= limit:
-                break
+                if len(out) >= limit:
+                    break
+        except ET.ParseError:
+            # Malformed or truncated feed: keep whatever items parsed cleanly before the error.
+            pass
         return out
 
 
@@ -547,6 +574,7 @@ class SeedSearchProvider:
         return out
 
 
+@lru_cache(maxsize=4096)
 def normalize_domain(url: str) -> str:
     value = str(url or "").strip()
     if not value:
@@ -560,6 +588,7 @@ def normalize_domain(url: str) -> str:
     return domain
 
 
+@lru_cache(maxsize=4096)
 def canonicalize_url(url: str) -> str:
     value = str(url or "").strip()
     if not value:
@@ -597,11 +626,13 @@ def is_job_board_url(url: str) -> bool:
     parsed = urlparse.urlparse(canonical)
     domain = (parsed.netloc or "").lower()
     path = (parsed.path or "").lower()
-    if any(marker in domain for marker in JOB_BOARD_DOMAIN_MARKERS):
+    # Hash lookups of the host and each parent domain ("boards.greenhouse.io", "greenhouse.io", ...).
+    labels = (parsed.hostname or "").split(".")
+    if any(".".join(labels[idx:]) in JOB_BOARD_DOMAINS for idx in range(len(labels) - 1)):
         return True
     if domain.startswith("jobs.") or domain.startswith("careers."):
         return True
-    if any(marker in path for marker in JOB_BOARD_PATH_MARKERS):
+    if JOB_BOARD_PATH_RE.search(path):
         return True
     if domain.endswith("linkedin.com") and "/jobs" in path:
         return True
@@ -621,10 +652,11 @@ def classify_source_kind(url: str, official_domain: str = "") -> str:
     return "general"
 
 
-def build_google_queries(company_name: str, website_url: str) -> List[str]:
+@lru_cache(maxsize=512)
+def build_google_queries(company_name: str, website_url: str) -> Tuple[str, ...]:
     name = " ".join(str(company_name or "").split()).strip()
     if not name:
-        return []
+        return ()
     domain = normalize_domain(website_url)
 
     candidates = [
@@ -658,23 +690,33 @@ def build_google_queries(company_name: str, website_url: str) -> List[str]:
             continue
         seen.add(key)
         out.append(query)
-    return out
+    return tuple(out)
 
 
 def score_search_result(result: SearchResult, official_domain: str) -> int:
+    return _score_search_fields(
+        url=result.url,
+        text=f"{result.title} {result.snippet}",
+        rank=result.rank,
+        official_domain=official_domain,
+        job_board=is_job_board_url(result.url),
+    )
+
+
+def _score_search_fields(*, url: str, text: str, rank: int, official_domain: str, job_board: bool) -> int:
     score = 0
-    domain = normalize_domain(result.url)
+    domain = normalize_domain(url)
     if official_domain and domain == official_domain:
         score += 300
     elif official_domain and domain.endswith(f".{official_domain}"):
         score += 220
-    if is_job_board_url(result.url):
+    if job_board:
         score += 180
 
-    rank = result.rank if result.rank > 0 else 99
+    rank = rank if rank > 0 else 99
     score += max(0, 120 - rank * 8)
 
-    title_blob = f"{result.title} {result.snippet}".lower()
+    title_blob = text.lower()
     for token in ("culture", "values", "mission", "about", "careers", "team"):
         if token in title_blob:
             score += 20
@@ -696,30 +738,42 @@ def select_top_urls(
     max_links = max(1, int(max_links or 1))
     min_job_board_links = max(0, int(min_job_board_links or 0))
 
-    dedup: Dict[str, SearchResult] = {}
+    # Project the best row per canonical URL into parallel columns, computing the canonical URL,
+    # job-board flag and score once per row; SearchResult objects are only built for the picks.
+    urls: List[str] = []
+    scores: List[int] = []
+    job_board: List[bool] = []
+    rows: List[SearchResult] = []
+    index_by_url: Dict[str, int] = {}
     for item in results:
         canonical = canonicalize_url(item.url)
         if not canonical:
             continue
-        normalized = SearchResult(
+        is_job_board = is_job_board_url(canonical)
+        score = _score_search_fields(
             url=canonical,
-            title=item.title,
-            snippet=item.snippet,
+            text=f"{item.title} {item.snippet}",
             rank=item.rank,
-            query=item.query,
+            official_domain=official_domain,
+            job_board=is_job_board,
         )
-        existing = dedup.get(canonical)
-        if existing is None or score_search_result(normalized, official_domain) > score_search_result(existing, official_domain):
-            dedup[canonical] = normalized
-
-    ranked = sorted(
-        dedup.values(),
-        key=lambda item: (
-            -score_search_result(item, official_domain),
-            item.rank if item.rank > 0 else 999,
-            item.url,
-        ),
-    )
+        idx = index_by_url.get(canonical)
+        if idx is None:
+            index_by_url[canonical] = len(urls)
+            urls.append(canonical)
+            scores.append(score)
+            job_board.append(is_job_board)
+            rows.append(item)
+        elif score > scores[idx]:
+            scores[idx] = score
+            rows[idx] = item
+
+    def rank_key(idx: int) -> Tuple[int, int, str]:
+        return (-scores[idx], rows[idx].rank if rows[idx].rank > 0 else 999, urls[idx])
+
+    def materialize(idx: int) -> SearchResult:
+        row = rows[idx]
+        return SearchResult(url=urls[idx], title=row.title, snippet=row.snippet, rank=row.rank, query=row.query)
 
     picked: List[SearchResult] = []
     seen: set[str] = set()
@@ -727,23 +781,20 @@ def select_top_urls(
         seen.add(normalized_force)
         picked.append(SearchResult(url=normalized_force, title="Official website", rank=0, query="seed"))
 
-    job_board_picked = 0
-    for item in ranked:
-        if len(picked) >= max_links or job_board_picked >= min_job_board_links:
-            break
-        if item.url in seen or not is_job_board_url(item.url):
-            continue
-        seen.add(item.url)
-        picked.append(item)
-        job_board_picked += 1
+    # Only the head of the ranking can be picked, so take bounded heaps instead of sorting every row.
+    job_board_quota = min(min_job_board_links, max(0, max_links - len(picked)))
+    job_board_rows = [idx for idx in range(len(urls)) if job_board[idx] and urls[idx] not in seen]
+    for idx in heapq.nsmallest(job_board_quota, job_board_rows, key=rank_key):
+        seen.add(urls[idx])
+        picked.append(materialize(idx))
 
-    for item in ranked:
+    for idx in heapq.nsmallest(max_links + len(seen), range(len(urls)), key=rank_key):
         if len(picked) >= max_links:
             break
-        if item.url in seen:
+        if urls[idx] in seen:
             continue
-        seen.add(item.url)
-        picked.append(item)
+        seen.add(urls[idx])
+        picked.append(materialize(idx))
     return picked[:max_links]
 
 
@@ -779,13 +830,13 @@ class UrllibPageFetcher:
 class SimpleHtmlTextExtractor:
     def extract_text(self, html: str, url: str) -> str:
         text = str(html or "")
-        text = re.sub(r"(?is)<script[^>]*>.*?</script>", " ", text)
-        text = re.sub(r"(?is)<style[^>]*>.*?</style>", " ", text)
-        text = re.sub(r"(?is)<!--.*?-->", " ", text)
-        text = re.sub(r"(?is)<[^>]+>", " ", text)
+        text = HTML_SCRIPT_RE.sub(" ", text)
+        text = HTML_STYLE_RE.sub(" ", text)
+        text = HTML_COMMENT_RE.sub(" ", text)
+        text = HTML_TAG_RE.sub(" ", text)
         text = html_utils.unescape(text)
-        text = re.sub(r"&nbsp;?", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = NBSP_ENTITY_RE.sub(" ", text)
+        text = WHITESPACE_RE.sub(" ", text).strip()
         return text
 
 
@@ -1355,6 +1406,8 @@ class CompanyCultureProfileService:
         min_job_board_links: int = 2,
         fetch_timeout_seconds: int = 15,
         min_text_chars: int = 600,
+        max_fetch_workers: int = 8,
+        max_fetches_per_host: int = 2,
     ) -> None:
         self.search_provider = search_provider
         self.page_fetcher = page_fetcher
@@ -1365,6 +1418,8 @@ class CompanyCultureProfileService:
         self.min_job_board_links = max(0, int(min_job_board_links))
         self.fetch_timeout_seconds = max(3, int(fetch_timeout_seconds))
         self.min_text_chars = max(1, int(min_text_chars))
+        self.max_fetch_workers = max(1, int(max_fetch_workers))
+        self.max_fetches_per_host = max(1, int(max_fetches_per_host))
 
     def generate(self, company_name: str, website_url: str) -> Dict[str, Any]:
         normalized_name = " ".join(str(company_name or "").split()).strip()
@@ -1402,10 +1457,7 @@ class CompanyCultureProfileService:
             min_job_board_links=self.min_job_board_links,
         )
 
-        sources: List[ScrapedSource] = []
-        for item in selected:
-            source = self._scrape_one(item, official_domain=official_domain)
-            sources.append(source)
+        sources = self._scrape_all(selected, official_domain=official_domain)
 
         success_sources = [item for item in sources if item.fetch_status == "ok"]
         job_board_insights = self._extract_job_board_insights(success_sources)
@@ -1442,7 +1494,7 @@ class CompanyCultureProfileService:
         return {
             "company_name": normalized_name,
             "website": normalized_website,
-            "search_queries": queries,
+            "search_queries": list(queries),
             "searched_links_total": len(raw_results),
             "selected_links_total": len(selected),
             "scraped_success_total": len(success_sources),
@@ -1453,6 +1505,23 @@ class CompanyCultureProfileService:
             "warnings": warnings,
         }
 
+    def _scrape_all(self, items: List[SearchResult], *, official_domain: str) -> List[ScrapedSource]:
+        if len(items) <= 1 or self.max_fetch_workers <= 1:
+            return [self._scrape_one(item, official_domain=official_domain) for item in items]
+
+        # Fetch concurrently so wall time tracks the slowest page, not the sum of all pages,
+        # while capping in-flight requests per host to stay polite.
+        host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        for item in items:
+            host_slots.setdefault(normalize_domain(item.url), threading.BoundedSemaphore(self.max_fetches_per_host))
+
+        def scrape(item: SearchResult) -> ScrapedSource:
+            with host_slots[normalize_domain(item.url)]:
+                return self._scrape_one(item, official_domain=official_domain)
+
+        with ThreadPoolExecutor(max_workers=min(len(items), self.max_fetch_workers)) as pool:
+            return list(pool.map(scrape, items))
+
     def _scrape_one(self, item: SearchResult, *, official_domain: str) -> ScrapedSource:
         domain = normalize_domain(item.url)
         source_kind = classify_source_kind(item.url, official_domain=official_domain)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+def load_json_config(path: str | Path, *, reload: bool = False) -> Any:
+    # The file bytes are cached by (path, mtime_ns, size), so services built over the same file skip the read.
+    # Every call parses its own copy, so instances never share mutable config. An explicit reload drops the
+    # cache first: an edit that keeps the size and lands within one mtime tick would otherwise read as stale.
+    if reload:
+        _read_json_config_bytes.cache_clear()
+    stat = Path(path).stat()
+    return json.loads(_read_json_config_bytes(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _read_json_config_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    return Path(path).read_bytes()
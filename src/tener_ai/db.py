@@ -17,6 +17,8 @@ AGENT_DEFAULT_NAMES = {
     "culture_analyst": "Harper AI (Culture Analyst)",
     "job_architect": "Spencer AI (Job Architect)",
 }
+# INSERT ... RETURNING lets upserts hand back the row id without a separate SELECT.
+SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 def utc_now_iso() -> str:
@@ -157,6 +159,14 @@ class Database:
         )
         self._conn.row_factory = sqlite3.Row
 
+    def clone_into(self, target: "Database") -> None:
+        # Page-level copy through the SQLite backup API; used to stamp out schema-initialized databases.
+        with self._conn.locked(), target._conn.locked():
+            self._conn.backup(target._conn)
+
+    def close(self) -> None:
+        self._conn.close()
+
     @contextmanager
     def transaction(self) -> Iterable[sqlite3.Connection]:
         with self._conn.locked():
@@ -268,6 +278,9 @@ class Database:
             FOREIGN KEY(conversation_id) REFERENCES conversations(id)
         );
 
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation_id_id
+            ON messages(conversation_id, id);
+
         CREATE TABLE IF NOT EXISTS operation_logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             operation TEXT NOT NULL,
@@ -1148,7 +1161,49 @@ class Database:
     def upsert_candidate(self, profile: Dict[str, Any], source: str = "linkedin") -> int:
         identity = self.extract_candidate_provider_identity(profile)
         linkedin_public_url = self.extract_linkedin_public_url(profile)
+        insert_params = (
+            profile["linkedin_id"],
+            identity.get("provider_id"),
+            identity.get("unipile_profile_id"),
+            identity.get("attendee_provider_id"),
+            linkedin_public_url,
+            profile.get("full_name"),
+            profile.get("headline"),
+            profile.get("location"),
+            json.dumps(profile.get("languages", [])),
+            json.dumps(profile.get("skills", [])),
+            profile.get("years_experience"),
+            source,
+            utc_now_iso(),
+        )
         with self.transaction() as conn:
+            if SQLITE_SUPPORTS_RETURNING:
+                row = conn.execute(
+                    """
+                    INSERT INTO candidates
+                    (
+                        linkedin_id, provider_id, unipile_profile_id, attendee_provider_id, linkedin_public_url,
+                        full_name, headline, location, languages, skills, years_experience, source, created_at
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(linkedin_id) DO UPDATE SET
+                        provider_id = COALESCE(excluded.provider_id, candidates.provider_id),
+                        unipile_profile_id = COALESCE(excluded.unipile_profile_id, candidates.unipile_profile_id),
+                        attendee_provider_id = COALESCE(excluded.attendee_provider_id, candidates.attendee_provider_id),
+                        linkedin_public_url = COALESCE(excluded.linkedin_public_url, candidates.linkedin_public_url),
+                        full_name = excluded.full_name,
+                        headline = excluded.headline,
+                        location = excluded.location,
+                        languages = excluded.languages,
+                        skills = excluded.skills,
+                        years_experience = excluded.years_experience,
+                        source = excluded.source
+                    RETURNING id
+                    """,
+                    insert_params,
+                ).fetchone()
+                return int(row["id"])
+
             existing = conn.execute(
                 "SELECT id FROM candidates WHERE linkedin_id = ?",
                 (profile["linkedin_id"],),
@@ -1190,21 +1245,7 @@ class Database:
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    profile.get("linkedin_id"),
-                    identity.get("provider_id"),
-                    identity.get("unipile_profile_id"),
-                    identity.get("attendee_provider_id"),
-                    linkedin_public_url,
-                    profile.get("full_name"),
-                    profile.get("headline"),
-                    profile.get("location"),
-                    json.dumps(profile.get("languages", [])),
-                    json.dumps(profile.get("skills", [])),
-                    profile.get("years_experience"),
-                    source,
-                    utc_now_iso(),
-                ),
+                insert_params,
             )
             return int(cur.lastrowid)
 
@@ -2158,10 +2199,24 @@ class Database:
         rows = self._conn.execute(query, tuple(args)).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
-    def list_messages(self, conversation_id: int) -> List[Dict[str, Any]]:
+    def list_messages(
+        self,
+        conversation_id: int,
+        *,
+        direction: Optional[str] = None,
+        meta_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        where_parts = ["conversation_id = ?"]
+        args: List[Any] = [conversation_id]
+        if direction is not None:
+            where_parts.append("direction = ?")
+            args.append(str(direction))
+        if meta_type is not None:
+            where_parts.append("json_extract(meta, '$.type') = ?")
+            args.append(str(meta_type))
         rows = self._conn.execute(
-            "SELECT * FROM messages WHERE conversation_id = ? ORDER BY id ASC",
-            (conversation_id,),
+            f"SELECT * FROM messages WHERE {' AND '.join(where_parts)} ORDER BY id ASC",
+            args,
         ).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
@@ -3608,6 +3663,45 @@ class Database:
             )
             return cur.rowcount > 0
 
+    def record_webhook_events(self, events: Iterable[tuple[str, str, Optional[Dict[str, Any]]]]) -> set[str]:
+        """Record a batch of ``(event_key, source, payload)`` events and return the keys that were new."""
+        pending: Dict[str, tuple[str, str, str, str]] = {}
+        for event_key, source, payload in events:
+            if event_key not in pending:
+                pending[event_key] = (event_key, source, json.dumps(payload or {}), utc_now_iso())
+        if not pending:
+            return set()
+        keys = list(pending)
+        with self.transaction() as conn:
+            existing: set[str] = set()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT event_key FROM webhook_events WHERE event_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                existing.update(str(row[0]) for row in rows)
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO webhook_events (event_key, source, payload, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                [row for key, row in pending.items() if key not in existing],
+            )
+        return {key for key in keys if key not in existing}
+
+    def forget_webhook_events(self, event_keys: Iterable[str]) -> None:
+        """Drop recorded events so a later poll treats them as new again."""
+        keys = list(dict.fromkeys(event_keys))
+        if not keys:
+            return
+        with self.transaction() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                conn.execute(f"DELETE FROM webhook_events WHERE event_key IN ({placeholders})", chunk)
+
     def upsert_job_step_progress(
         self,
         job_id: int,
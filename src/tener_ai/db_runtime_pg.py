@@ -1275,12 +1275,26 @@ class PostgresRuntimeDatabase(PostgresReadDatabase):
                 rows = cur.fetchall()
         return [self._row_to_dict(dict(r)) for r in rows]
 
-    def list_messages(self, conversation_id: int) -> List[Dict[str, Any]]:
+    def list_messages(
+        self,
+        conversation_id: int,
+        *,
+        direction: Optional[str] = None,
+        meta_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        where_parts = ["conversation_id = %s"]
+        args: List[Any] = [int(conversation_id)]
+        if direction is not None:
+            where_parts.append("direction = %s")
+            args.append(str(direction))
+        if meta_type is not None:
+            where_parts.append("meta->>'type' = %s")
+            args.append(str(meta_type))
         with self._connect() as conn:
             with conn.cursor(row_factory=self._psycopg.rows.dict_row) as cur:
                 cur.execute(
-                    "SELECT * FROM messages WHERE conversation_id = %s ORDER BY id ASC",
-                    (int(conversation_id),),
+                    f"SELECT * FROM messages WHERE {' AND '.join(where_parts)} ORDER BY id ASC",
+                    args,
                 )
                 rows = cur.fetchall()
         return [self._row_to_dict(dict(r)) for r in rows]
@@ -2836,6 +2850,37 @@ class PostgresRuntimeDatabase(PostgresReadDatabase):
                 )
                 return int(cur.rowcount or 0) > 0
 
+    def record_webhook_events(self, events: Iterable[tuple[str, str, Optional[Dict[str, Any]]]]) -> set[str]:
+        pending: Dict[str, tuple[str, str, Any, str]] = {}
+        for event_key, source, payload in events:
+            if event_key not in pending:
+                pending[event_key] = (event_key, source, self._json(payload or {}), utc_now_iso())
+        if not pending:
+            return set()
+        placeholders = ", ".join("(%s, %s, %s, %s)" for _ in pending)
+        params = [value for row in pending.values() for value in row]
+        with self.transaction() as conn:
+            with conn.cursor(row_factory=self._psycopg.rows.dict_row) as cur:
+                cur.execute(
+                    f"""
+                    INSERT INTO webhook_events (event_key, source, payload, created_at)
+                    VALUES {placeholders}
+                    ON CONFLICT(event_key) DO NOTHING
+                    RETURNING event_key
+                    """,
+                    params,
+                )
+                rows = cur.fetchall()
+        return {str(row["event_key"]) for row in rows}
+
+    def forget_webhook_events(self, event_keys: Iterable[str]) -> None:
+        keys = list(dict.fromkeys(event_keys))
+        if not keys:
+            return
+        with self.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM webhook_events WHERE event_key = ANY(%s)", (keys,))
+
     def upsert_job_step_progress(
         self,
         job_id: int,
@@ -4,22 +4,76 @@ import copy
 import json
 import re
 import threading
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .contracts import normalize_emulator_project
 
 
+def _parse_project(raw: bytes, *, source: str) -> Dict[str, Any]:
+    return normalize_emulator_project(json.loads(raw), source=source)
+
+
+# Parsed files are keyed by (path, mtime_ns, size) so repeated store
+# constructions and no-op reloads skip JSON parsing, while an edited file
+# misses the cache. Cached values are shared and must not be mutated.
+@lru_cache(maxsize=256)
+def _load_project_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return _parse_project(Path(path).read_bytes(), source=Path(path).name)
+
+
+@lru_cache(maxsize=16)
+def _load_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    return json.loads(Path(path).read_bytes())
+
+
+def _stat_key(path: Path) -> Tuple[str, int, int]:
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached_project_file(path: Path) -> Dict[str, Any]:
+    return _load_project_file(*_stat_key(path))
+
+
+def _load_cached_json_file(path: Path) -> Any:
+    return _load_json_file(*_stat_key(path))
+
+
 class EmulatorProjectStore:
     def __init__(self, projects_dir: str | Path, company_profiles_path: str | Path) -> None:
         self.projects_dir = Path(projects_dir)
         self.company_profiles_path = Path(company_profiles_path)
+        self._raw_projects: Optional[Dict[str, bytes]] = None
+        self._raw_company_profiles: Optional[bytes] = None
+        self._init_state()
+        self.reload()
+
+    @classmethod
+    def from_raw(
+        cls,
+        projects: Dict[str, bytes],
+        company_profiles_json: bytes,
+        *,
+        company_profiles_name: str = "company_profiles.json",
+    ) -> "EmulatorProjectStore":
+        # Same validation as the on-disk store, fed from file contents keyed by file name.
+        store = cls.__new__(cls)
+        store.projects_dir = Path()
+        store.company_profiles_path = Path(company_profiles_name)
+        store._raw_projects = dict(projects)
+        store._raw_company_profiles = bytes(company_profiles_json)
+        store._init_state()
+        store.reload()
+        return store
+
+    def _init_state(self) -> None:
         self._lock = threading.Lock()
         self._projects_by_id: Dict[str, Dict[str, Any]] = {}
         self._project_order: List[str] = []
         self._company_profiles: Dict[str, Dict[str, Any]] = {}
         self._load_error: Optional[str] = None
-        self.reload()
 
     @property
     def load_error(self) -> Optional[str]:
@@ -27,33 +81,48 @@ class EmulatorProjectStore:
 
     def reload(self) -> Dict[str, Any]:
         errors: List[str] = []
-        projects_by_id: Dict[str, Dict[str, Any]] = {}
-        project_order: List[str] = []
+        project_sources: List[Tuple[str, Callable[[], Dict[str, Any]]]] = []
+        profiles_source: Optional[Tuple[str, Callable[[], Any]]] = None
 
-        if self.projects_dir.exists():
-            for path in sorted(self.projects_dir.glob("*.json")):
-                try:
-                    payload = json.loads(path.read_text(encoding="utf-8"))
-                    project = normalize_emulator_project(payload, source=str(path.name))
-                    project_id = str(project["id"])
-                    if project_id in projects_by_id:
-                        raise ValueError(f"duplicate project id '{project_id}'")
-                    projects_by_id[project_id] = project
-                    project_order.append(project_id)
-                except Exception as exc:
-                    errors.append(f"{path.name}: {exc}")
+        if self._raw_projects is not None:
+            for name, raw in sorted(self._raw_projects.items()):
+                project_sources.append((name, partial(_parse_project, raw, source=name)))
+            profiles_source = (self.company_profiles_path.name, partial(json.loads, self._raw_company_profiles or b""))
         else:
-            errors.append(f"projects dir not found: {self.projects_dir}")
+            if self.projects_dir.exists():
+                for path in sorted(self.projects_dir.glob("*.json")):
+                    project_sources.append((path.name, partial(_load_cached_project_file, path)))
+            else:
+                errors.append(f"projects dir not found: {self.projects_dir}")
+
+            if self.company_profiles_path.exists():
+                profiles_source = (
+                    self.company_profiles_path.name,
+                    partial(_load_cached_json_file, self.company_profiles_path),
+                )
+            else:
+                errors.append(f"company profiles file not found: {self.company_profiles_path}")
+
+        projects_by_id: Dict[str, Dict[str, Any]] = {}
+        project_order: List[str] = []
+        for name, load_project in project_sources:
+            try:
+                project = load_project()
+                project_id = str(project["id"])
+                if project_id in projects_by_id:
+                    raise ValueError(f"duplicate project id '{project_id}'")
+                projects_by_id[project_id] = project
+                project_order.append(project_id)
+            except Exception as exc:
+                errors.append(f"{name}: {exc}")
 
         company_profiles: Dict[str, Dict[str, Any]] = {}
-        if self.company_profiles_path.exists():
+        if profiles_source is not None:
+            name, load_profiles = profiles_source
             try:
-                payload = json.loads(self.company_profiles_path.read_text(encoding="utf-8"))
-                company_profiles = self._normalize_company_profiles(payload)
+                company_profiles = self._normalize_company_profiles(load_profiles())
             except Exception as exc:
-                errors.append(f"{self.company_profiles_path.name}: {exc}")
-        else:
-            errors.append(f"company profiles file not found: {self.company_profiles_path}")
+                errors.append(f"{name}: {exc}")
 
         with self._lock:
             self._projects_by_id = projects_by_id
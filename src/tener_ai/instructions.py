@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 
 DEFAULT_INSTRUCTIONS: Dict[str, Any] = {
@@ -45,8 +45,7 @@ class AgentInstructions:
         file_path = Path(path)
         if not file_path.exists():
             return dict(DEFAULT_INSTRUCTIONS)
-        with file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(file_path.read_bytes())
         if not isinstance(data, dict):
             return dict(DEFAULT_INSTRUCTIONS)
         raw_agents = data.get("agents")
@@ -55,16 +54,21 @@ class AgentInstructions:
             return data
 
         base_dir = file_path.parent
+        file_cache: Dict[Path, str] = {}
         normalized: Dict[str, str] = {}
         for key, value in raw_agents.items():
             if not isinstance(key, str):
                 continue
-            normalized[key] = AgentInstructions._resolve_agent_instruction(value=value, base_dir=base_dir)
+            normalized[key] = AgentInstructions._resolve_agent_instruction(
+                value=value,
+                base_dir=base_dir,
+                file_cache=file_cache,
+            )
         data["agents"] = normalized
         return data
 
     @staticmethod
-    def _resolve_agent_instruction(value: Any, base_dir: Path) -> str:
+    def _resolve_agent_instruction(value: Any, base_dir: Path, file_cache: Dict[Path, str] | None = None) -> str:
         if isinstance(value, str):
             return value
         if not isinstance(value, dict):
@@ -81,21 +85,30 @@ class AgentInstructions:
         target = Path(file_ref)
         if not target.is_absolute():
             target = base_dir / target
+        # Several agents/stages often share one instruction file; read it once per load.
+        if file_cache is not None and target in file_cache:
+            return file_cache[target]
         if not target.exists():
-            return ""
-        try:
-            return target.read_text(encoding="utf-8")
-        except OSError:
-            return ""
+            text = ""
+        else:
+            try:
+                text = target.read_text(encoding="utf-8")
+            except OSError:
+                text = ""
+        if file_cache is not None:
+            file_cache[target] = text
+        return text
 
 
 class AgentEvaluationPlaybook:
     def __init__(self, path: str | None = None) -> None:
         self.path = path
         self.payload = self._load(path)
+        self._stage_instructions, self._wildcard_instructions = self._index_stages(self.payload)
 
     def reload(self) -> None:
         self.payload = self._load(self.path)
+        self._stage_instructions, self._wildcard_instructions = self._index_stages(self.payload)
 
     def get_agent_name(self, agent_key: str, fallback: str = "") -> str:
         agents = self.payload.get("agents")
@@ -108,22 +121,32 @@ class AgentEvaluationPlaybook:
         return name if isinstance(name, str) else fallback
 
     def get_instruction(self, agent_key: str, stage_key: str | None = None, fallback: str = "") -> str:
-        agents = self.payload.get("agents")
+        if stage_key:
+            value = self._stage_instructions.get((agent_key, stage_key))
+            if value is not None:
+                return value
+        return self._wildcard_instructions.get(agent_key, fallback)
+
+    @staticmethod
+    def _index_stages(payload: Dict[str, Any]) -> Tuple[Dict[Tuple[str, str], str], Dict[str, str]]:
+        # Flatten agents -> stages once per load so get_instruction is a single dict probe.
+        stage_instructions: Dict[Tuple[str, str], str] = {}
+        wildcard_instructions: Dict[str, str] = {}
+        agents = payload.get("agents")
         if not isinstance(agents, dict):
-            return fallback
-        entry = agents.get(agent_key)
-        if not isinstance(entry, dict):
-            return fallback
-        stages = entry.get("stages")
-        if not isinstance(stages, dict):
-            return fallback
-        stage_value = stages.get(stage_key) if stage_key else None
-        if isinstance(stage_value, str):
-            return stage_value
-        wildcard = stages.get("*")
-        if isinstance(wildcard, str):
-            return wildcard
-        return fallback
+            return stage_instructions, wildcard_instructions
+        for agent_key, entry in agents.items():
+            stages = entry.get("stages") if isinstance(entry, dict) else None
+            if not isinstance(stages, dict):
+                continue
+            for stage_key, value in stages.items():
+                if not isinstance(value, str):
+                    continue
+                if stage_key == "*":
+                    wildcard_instructions[agent_key] = value
+                else:
+                    stage_instructions[(agent_key, stage_key)] = value
+        return stage_instructions, wildcard_instructions
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -139,8 +162,7 @@ class AgentEvaluationPlaybook:
         file_path = Path(path)
         if not file_path.exists():
             return dict(DEFAULT_EVALUATION_PLAYBOOK)
-        with file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(file_path.read_bytes())
         if not isinstance(data, dict):
             return dict(DEFAULT_EVALUATION_PLAYBOOK)
         raw_agents = data.get("agents")
@@ -149,6 +171,7 @@ class AgentEvaluationPlaybook:
             return data
 
         base_dir = file_path.parent
+        file_cache: Dict[Path, str] = {}
         normalized: Dict[str, Dict[str, Any]] = {}
         for key, value in raw_agents.items():
             if not isinstance(key, str):
@@ -162,7 +185,11 @@ class AgentEvaluationPlaybook:
                 for stage_key, stage_value in raw_stages.items():
                     if not isinstance(stage_key, str):
                         continue
-                    resolved = AgentInstructions._resolve_agent_instruction(stage_value, base_dir=base_dir)
+                    resolved = AgentInstructions._resolve_agent_instruction(
+                        stage_value,
+                        base_dir=base_dir,
+                        file_cache=file_cache,
+                    )
                     if resolved:
                         stages[stage_key] = resolved
             normalized[key] = {
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Iterable
 
 
@@ -53,6 +54,16 @@ LANGUAGE_MARKERS = {
     "tr": {"maas", "maaş", "surec", "süreç", "mulakat", "mülakat", "merhaba"},
 }
 
+CHAR_LANGUAGE_MARKERS = {
+    "de": ("ä", "ö", "ü", "ß"),
+    "es": ("¿", "¡", "ñ"),
+    "fr": ("à", "â", "ç", "è", "ê", "ë", "î", "ï", "ô", "ù", "û", "ü", "œ"),
+    "it": ("à", "è", "é", "ì", "í", "î", "ò", "ó", "ù"),
+    "pl": ("ą", "ć", "ę", "ł", "ń", "ś", "ź", "ż"),
+    "pt": ("ã", "õ"),
+    "tr": ("ç", "ğ", "ı", "ö", "ş", "ü"),
+}
+
 LOCATION_LANGUAGE_HINTS = {
     "uk": (
         "ukraine",
@@ -133,47 +144,61 @@ def resolve_outbound_language(candidate: Dict[str, Any] | None, fallback: str =
     return normalize_language(fallback, fallback="en") or "en"
 
 
+def _compile_marker_pattern(markers: Iterable[str]) -> re.Pattern[str]:
+    # Single words must not sit inside a longer Latin word; phrases match as plain substrings.
+    words = sorted(re.escape(m) for m in markers if " " not in m)
+    phrases = sorted(re.escape(m) for m in markers if " " in m)
+    alternatives = [rf"(?<![a-z])(?:{'|'.join(words)})(?![a-z])"] if words else []
+    return re.compile("|".join(alternatives + phrases))
+
+
+_ARABIC_CHARS = re.compile("[\u0600-\u06ff]")
+_UKRAINIAN_CHARS = re.compile("[іїєґ]")
+_RUSSIAN_CHARS = re.compile("[а-яё]")
+_CHAR_MARKER_PATTERNS = tuple(
+    (language, re.compile(f"[{''.join(markers)}]")) for language, markers in CHAR_LANGUAGE_MARKERS.items()
+)
+_WORD_MARKER_PATTERNS = tuple(
+    (language, _compile_marker_pattern(markers)) for language, markers in LANGUAGE_MARKERS.items()
+)
+
+
+# Chat replies and FAQ snippets repeat, so short texts are memoized; long ones would only churn the cache.
+DETECTION_CACHE_MAX_CHARS = 280
+
+
 def detect_language_from_text_or_none(text: str) -> str | None:
     normalized = (text or "").strip().lower()
     if not normalized:
         return None
+    if len(normalized) <= DETECTION_CACHE_MAX_CHARS:
+        return _detect_cached(normalized)
+    return _detect_normalized(normalized)
 
-    if any("\u0600" <= ch <= "\u06ff" for ch in normalized):
-        return "ar"
-    if any(ch in normalized for ch in ("і", "ї", "є", "ґ")):
-        return "uk"
-    if any("а" <= ch <= "я" or ch == "ё" for ch in normalized):
-        return "ru"
-
-    char_markers = {
-        "de": ("ä", "ö", "ü", "ß"),
-        "es": ("¿", "¡", "ñ"),
-        "fr": ("à", "â", "ç", "è", "ê", "ë", "î", "ï", "ô", "ù", "û", "ü", "œ"),
-        "it": ("à", "è", "é", "ì", "í", "î", "ò", "ó", "ù"),
-        "pl": ("ą", "ć", "ę", "ł", "ń", "ś", "ź", "ż"),
-        "pt": ("ã", "õ"),
-        "tr": ("ç", "ğ", "ı", "ö", "ş", "ü"),
-    }
-    for language, markers in char_markers.items():
-        if any(marker in normalized for marker in markers):
-            return language
 
-    for language, markers in LANGUAGE_MARKERS.items():
-        if any(_contains_language_marker(normalized, marker) for marker in markers):
-            return language
-    return None
+@lru_cache(maxsize=1024)
+def _detect_cached(normalized: str) -> str | None:
+    return _detect_normalized(normalized)
 
 
-def _contains_language_marker(text: str, marker: str) -> bool:
-    normalized_text = str(text or "").strip().lower()
-    normalized_marker = str(marker or "").strip().lower()
-    if not normalized_text or not normalized_marker:
-        return False
-    if " " in normalized_marker:
-        return normalized_marker in normalized_text
-    if re.search(rf"(?<![a-z]){re.escape(normalized_marker)}(?![a-z])", normalized_text):
-        return True
-    return False
+def _detect_normalized(normalized: str) -> str | None:
+    # Script and accent markers are all non-ASCII, so plain ASCII text only needs the word markers.
+    if not normalized.isascii():
+        if _ARABIC_CHARS.search(normalized):
+            return "ar"
+        if _UKRAINIAN_CHARS.search(normalized):
+            return "uk"
+        if _RUSSIAN_CHARS.search(normalized):
+            return "ru"
+
+        for language, pattern in _CHAR_MARKER_PATTERNS:
+            if pattern.search(normalized):
+                return language
+
+    for language, pattern in _WORD_MARKER_PATTERNS:
+        if pattern.search(normalized):
+            return language
+    return None
 
 
 def detect_language_from_text(text: str, fallback: str = "en") -> str:
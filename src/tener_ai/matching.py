@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import re
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from .config_cache import load_json_config
 
 
 QA_MUST_HAVE_SKILLS = [
@@ -105,9 +105,20 @@ class MatchingEngine:
     def __init__(self, rules_path: str) -> None:
         self.rules_path = rules_path
         self.rules = self._load_rules()
+        self._index_skill_dictionaries()
 
     def reload(self) -> None:
-        self.rules = self._load_rules()
+        self.rules = self._load_rules(reload=True)
+        self._index_skill_dictionaries()
+
+    def _index_skill_dictionaries(self) -> None:
+        # verify() and requirement extraction scan these on every call; normalize them once per load.
+        self._skill_dictionary: Tuple[str, ...] = tuple(
+            s.lower() for s in self.rules.get("skill_dictionary", []) if isinstance(s, str)
+        )
+        self._role_skill_dictionaries: Dict[str | None, Tuple[str, ...]] = {
+            role_family: tuple(self._build_skill_dictionary_for_role(role_family)) for role_family in (None, "qa")
+        }
 
     def verify(self, job: Dict[str, Any], profile: Dict[str, Any]) -> MatchResult:
         rules = self.rules
@@ -454,8 +465,11 @@ class MatchingEngine:
             return "qa"
         return None
 
-    def _skill_dictionary_for_role(self, role_family: str | None) -> List[str]:
-        dictionary = [s.lower() for s in self.rules.get("skill_dictionary", [])]
+    def _skill_dictionary_for_role(self, role_family: str | None) -> Tuple[str, ...]:
+        return self._role_skill_dictionaries.get(role_family) or self._role_skill_dictionaries[None]
+
+    def _build_skill_dictionary_for_role(self, role_family: str | None) -> List[str]:
+        dictionary = list(self._skill_dictionary)
         dictionary.extend(QA_MUST_HAVE_SKILLS)
         dictionary.extend(QA_NICE_TO_HAVE_SKILLS)
         dictionary.extend(QA_QUESTIONABLE_SKILLS)
@@ -488,7 +502,7 @@ class MatchingEngine:
         pattern = re.compile(rf"(?<![a-z0-9]){escaped}(?![a-z0-9])")
         return bool(pattern.search(str(text or "").lower()))
 
-    def _extract_known_skills(self, text: str, dictionary: List[str]) -> List[str]:
+    def _extract_known_skills(self, text: str, dictionary: Sequence[str]) -> List[str]:
         found: List[str] = []
         seen: Set[str] = set()
         for skill in dictionary:
@@ -639,12 +653,11 @@ class MatchingEngine:
 
     def _candidate_skills(self, profile: Dict[str, Any]) -> Set[str]:
         skills = {s.lower() for s in profile.get("skills", []) if isinstance(s, str) and s.strip()}
-        dictionary = [s.lower() for s in self.rules.get("skill_dictionary", [])]
-        evidence = self._match_skills_with_evidence(profile=profile, skills=dictionary)
+        evidence = self._match_skills_with_evidence(profile=profile, skills=self._skill_dictionary)
         inferred = {skill.lower() for skill in evidence["strong_matches"] + evidence["weak_matches"]}
         return skills | inferred
 
-    def _match_skills_with_evidence(self, *, profile: Dict[str, Any], skills: List[str]) -> Dict[str, Any]:
+    def _match_skills_with_evidence(self, *, profile: Dict[str, Any], skills: Sequence[str]) -> Dict[str, Any]:
         if not skills:
             return {"weight": 0.0, "strong_matches": [], "weak_matches": [], "evidence": {}}
 
@@ -964,7 +977,5 @@ class MatchingEngine:
                 tokens.update(aliases)
         return {token for token in tokens if token}
 
-    def _load_rules(self) -> Dict[str, Any]:
-        path = Path(self.rules_path)
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+    def _load_rules(self, *, reload: bool = False) -> Dict[str, Any]:
+        return load_json_config(self.rules_path, reload=reload)
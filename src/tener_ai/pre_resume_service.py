@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
+import copy
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .config_cache import load_json_config
 from .language import normalize_language, resolve_conversation_language
 from .message_extraction import (
     CandidateMessageExtractionResult,
@@ -701,13 +702,14 @@ class PreResumeCommunicationService:
 
     @staticmethod
     def _load_templates(path: Optional[str]) -> Dict[str, Any]:
+        # Defaults are deep-copied so no instance can mutate the module-level templates or another instance's.
+        defaults = copy.deepcopy(DEFAULT_TEMPLATES)
         if not path:
-            return dict(DEFAULT_TEMPLATES)
+            return defaults
         file_path = Path(path)
         if not file_path.exists():
-            return dict(DEFAULT_TEMPLATES)
-        with file_path.open("r", encoding="utf-8") as f:
-            loaded = json.load(f)
+            return defaults
+        loaded = load_json_config(file_path)
         if not isinstance(loaded, dict):
-            return dict(DEFAULT_TEMPLATES)
-        return merge_template_dict(DEFAULT_TEMPLATES, loaded)
+            return defaults
+        return merge_template_dict(defaults, loaded)
@@ -11,7 +11,7 @@ import re
 from urllib import request as urlrequest
 import zipfile
 from uuid import uuid4
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from .agents import FAQAgent, OutreachAgent, SourcingAgent, VerificationAgent
 from .attachments import (
@@ -91,6 +91,7 @@ class WorkflowService:
         require_resume_before_final_verify: bool = False,
         stage_instructions: Dict[str, str] | None = None,
         forced_test_ids_path: str | None = None,
+        forced_test_ids: Iterable[str] | None = None,
         forced_test_score: float = DEFAULT_FORCED_TEST_SCORE,
         interview_invite_ttl_hours: int = 72,
         interview_max_followups: int = 2,
@@ -116,6 +117,10 @@ class WorkflowService:
         self.require_resume_before_final_verify = require_resume_before_final_verify
         self.stage_instructions = dict(stage_instructions or {})
         self.forced_test_ids_path = (forced_test_ids_path or "").strip() or None
+        # Explicit identifiers take precedence over the file, which is otherwise re-read on every call.
+        self.forced_test_ids = (
+            self._normalize_forced_test_identifiers(forced_test_ids) if forced_test_ids is not None else None
+        )
         try:
             self.forced_test_score = float(forced_test_score)
         except (TypeError, ValueError):
@@ -592,14 +597,16 @@ class WorkflowService:
         forced_test_ids: List[str] | None = None,
         job_culture_profile: Dict[str, Any] | None = None,
     ) -> Dict[str, Any]:
-        score, status, notes = self.verification_agent.verify_candidate(job=job, profile=profile)
-        notes = dict(notes or {})
+        forced_identifier = self._forced_test_identifier_for_profile(profile, forced_test_ids or [])
+        if forced_identifier:
+            # Forced test candidates are always verified at the forced score, so the matching pass is skipped.
+            score, status, notes = self.forced_test_score, "verified", {}
+        else:
+            score, status, notes = self.verification_agent.verify_candidate(job=job, profile=profile)
+            notes = dict(notes or {})
         if isinstance(job_culture_profile, dict) and job_culture_profile and not isinstance(notes.get("company_culture_profile"), dict):
             notes["company_culture_profile"] = job_culture_profile
-        forced_identifier = self._forced_test_identifier_for_profile(profile, forced_test_ids or [])
         if forced_identifier:
-            score = max(float(score), self.forced_test_score)
-            status = "verified"
             notes["forced_test_candidate"] = True
             notes["forced_test_identifier"] = forced_identifier
             notes["forced_score"] = self.forced_test_score
@@ -3327,6 +3334,7 @@ class WorkflowService:
                 ignored += 1
                 continue
 
+            pending: List[tuple[str, Dict[str, Any], str, str, str]] = []
             for message in messages:
                 if not isinstance(message, dict):
                     ignored += 1
@@ -3350,73 +3358,87 @@ class WorkflowService:
                     f"{external_chat_id}|{sender_provider_id}|{occurred_at}|{text}".encode("utf-8")
                 ).hexdigest()
                 event_key = f"poll-unipile:{external_chat_id}:{dedupe_tail}"
-                is_new = self.db.record_webhook_event(
-                    event_key=event_key,
-                    source="unipile_poll",
-                    payload=(message.get("raw") if isinstance(message.get("raw"), dict) else message),
+                pending.append((event_key, message, text, provider_message_id, occurred_at))
+
+            # One dedup round-trip per chat instead of one per message.
+            new_event_keys = self.db.record_webhook_events(
+                (
+                    event_key,
+                    "unipile_poll",
+                    message.get("raw") if isinstance(message.get("raw"), dict) else message,
                 )
-                if not is_new:
-                    duplicates += 1
-                    continue
+                for event_key, message, _, _, _ in pending
+            )
+            # Keys are recorded before processing; if the loop aborts, forget the ones it never reached so the
+            # next poll retries them instead of counting them as duplicates.
+            try:
+                for event_key, message, text, provider_message_id, occurred_at in pending:
+                    if event_key not in new_event_keys:
+                        duplicates += 1
+                        continue
+                    new_event_keys.discard(event_key)
 
-                try:
-                    result = self.process_inbound_message(
-                        conversation_id=conversation_id,
-                        text=text,
-                        inbound_meta={
-                            "type": "candidate_message",
-                            "provider": "unipile_poll",
-                            "provider_message_id": provider_message_id or None,
-                            "occurred_at": occurred_at or None,
-                            "attachments": message.get("attachments") if isinstance(message.get("attachments"), list) else None,
-                            "raw": message.get("raw") if isinstance(message.get("raw"), dict) else message,
-                        },
-                    )
-                except Exception as exc:
-                    errors += 1
+                    try:
+                        result = self.process_inbound_message(
+                            conversation_id=conversation_id,
+                            text=text,
+                            inbound_meta={
+                                "type": "candidate_message",
+                                "provider": "unipile_poll",
+                                "provider_message_id": provider_message_id or None,
+                                "occurred_at": occurred_at or None,
+                                "attachments": message.get("attachments") if isinstance(message.get("attachments"), list) else None,
+                                "raw": message.get("raw") if isinstance(message.get("raw"), dict) else message,
+                            },
+                        )
+                    except Exception as exc:
+                        errors += 1
+                        items.append(
+                            {
+                                "conversation_id": conversation_id,
+                                "external_chat_id": external_chat_id,
+                                "provider_message_id": provider_message_id or None,
+                                "status": "error",
+                                "error": str(exc),
+                            }
+                        )
+                        self.db.log_operation(
+                            operation="poll.unipile.inbound.error",
+                            status="error",
+                            entity_type="conversation",
+                            entity_id=str(conversation_id),
+                            details={
+                                "external_chat_id": external_chat_id,
+                                "provider_message_id": provider_message_id or None,
+                                "error": str(exc),
+                            },
+                        )
+                        continue
+
+                    processed += 1
                     items.append(
                         {
                             "conversation_id": conversation_id,
                             "external_chat_id": external_chat_id,
                             "provider_message_id": provider_message_id or None,
-                            "status": "error",
-                            "error": str(exc),
+                            "status": "processed",
+                            "result_mode": str(result.get("mode") or "faq"),
                         }
                     )
                     self.db.log_operation(
-                        operation="poll.unipile.inbound.error",
-                        status="error",
+                        operation="poll.unipile.inbound.processed",
+                        status="ok",
                         entity_type="conversation",
                         entity_id=str(conversation_id),
                         details={
                             "external_chat_id": external_chat_id,
                             "provider_message_id": provider_message_id or None,
-                            "error": str(exc),
+                            "result_mode": str(result.get("mode") or "faq"),
                         },
                     )
-                    continue
-
-                processed += 1
-                items.append(
-                    {
-                        "conversation_id": conversation_id,
-                        "external_chat_id": external_chat_id,
-                        "provider_message_id": provider_message_id or None,
-                        "status": "processed",
-                        "result_mode": str(result.get("mode") or "faq"),
-                    }
-                )
-                self.db.log_operation(
-                    operation="poll.unipile.inbound.processed",
-                    status="ok",
-                    entity_type="conversation",
-                    entity_id=str(conversation_id),
-                    details={
-                        "external_chat_id": external_chat_id,
-                        "provider_message_id": provider_message_id or None,
-                        "result_mode": str(result.get("mode") or "faq"),
-                    },
-                )
+            except BaseException:
+                self.db.forget_webhook_events(new_event_keys)
+                raise
 
         return {
             "job_id": job_id,
@@ -7609,6 +7631,8 @@ class WorkflowService:
         return None
 
     def _load_forced_test_identifiers(self) -> List[str]:
+        if self.forced_test_ids is not None:
+            return list(self.forced_test_ids)
         path_raw = self.forced_test_ids_path or ""
         if not path_raw:
             return []
@@ -7617,10 +7641,14 @@ class WorkflowService:
             text = path.read_text(encoding="utf-8")
         except OSError:
             return []
+        return self._normalize_forced_test_identifiers(text.splitlines())
+
+    @staticmethod
+    def _normalize_forced_test_identifiers(lines: Iterable[str]) -> List[str]:
         out: List[str] = []
         seen: set[str] = set()
-        for raw_line in text.splitlines():
-            line = raw_line.split("#", 1)[0].strip().lower()
+        for raw_line in lines:
+            line = str(raw_line or "").split("#", 1)[0].strip().lower()
             if not line:
                 continue
             if line in seen:
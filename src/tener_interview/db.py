@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 from contextlib import contextmanager
@@ -14,6 +15,11 @@ def utc_now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def idempotency_payload_hash(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 def _require_psycopg() -> Any:
     try:
         import psycopg  # type: ignore
@@ -29,6 +35,12 @@ class InterviewDatabase:
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
 
+    def clone_into(self, target: "InterviewDatabase") -> None:
+        self._conn.backup(target._conn)
+
+    def close(self) -> None:
+        self._conn.close()
+
     @contextmanager
     def transaction(self) -> Iterable[sqlite3.Connection]:
         try:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import re
 from http import HTTPStatus
@@ -12,7 +11,7 @@ from urllib.parse import parse_qs, urlparse
 from tener_ai.db_read_pg import PostgresReadDatabase
 
 from .config import InterviewModuleConfig
-from .db import InterviewPostgresDatabase
+from .db import InterviewPostgresDatabase, idempotency_payload_hash
 from .providers import HireflixConfig, HireflixHTTPAdapter, HireflixMockAdapter
 from .question_generation import InterviewQuestionGenerator
 from .scoring import InterviewScoringEngine
@@ -551,7 +550,7 @@ class InterviewRequestHandler(BaseHTTPRequestHandler):
             self._json_response(status, out)
             return
 
-        payload_hash = self._payload_hash(payload)
+        payload_hash = idempotency_payload_hash(payload)
         existing = SERVICES["db"].get_idempotency_record(route=route, key=key)
         if existing:
             if str(existing.get("payload_hash")) != payload_hash:
@@ -624,11 +623,6 @@ class InterviewRequestHandler(BaseHTTPRequestHandler):
         except ValueError:
             return None
 
-    @staticmethod
-    def _payload_hash(payload: Dict[str, Any]) -> str:
-        raw = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
-
     @staticmethod
     def _error(code: str, message: str, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return {
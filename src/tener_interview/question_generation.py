@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List
 
+from tener_ai.config_cache import load_json_config
+
 
 DEFAULT_GUIDELINES: Dict[str, Any] = {
     "version": "1.0",
@@ -56,6 +61,8 @@ DEFAULT_GUIDELINES: Dict[str, Any] = {
     ],
 }
 
+GENERATION_CACHE_SIZE = 64
+
 QA_FOCUS_AREAS = [
     "web applications and APIs",
     "end-to-end candidate pipelines",
@@ -75,8 +82,30 @@ class InterviewQuestionGenerator:
         self.company_profile = self._load_company_profile(company_profile_path)
         profile_company_name = str(self.company_profile.get("company_name") or "").strip()
         self.company_name = company_name.strip() or profile_company_name or "Tener"
+        self._generated: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._generated_lock = threading.Lock()
 
     def generate_for_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        # Guidelines and company profile are fixed per instance, so the output depends only on the job.
+        # Every interview session resolves its assessment through here; repeat sessions for an unchanged
+        # job reuse the generated payload instead of re-running extraction and templating.
+        job_key = hashlib.blake2b(
+            json.dumps(job, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        with self._generated_lock:
+            cached = self._generated.get(job_key)
+            if cached is not None:
+                self._generated.move_to_end(job_key)
+        if cached is None:
+            cached = self._generate_for_job(job)
+            with self._generated_lock:
+                self._generated[job_key] = cached
+                if len(self._generated) > GENERATION_CACHE_SIZE:
+                    self._generated.popitem(last=False)
+        return copy.deepcopy(cached)
+
+    def _generate_for_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
         title = str(job.get("title") or "Open Role").strip()
         jd_text = str(job.get("jd_text") or "").strip()
         job_company_name = str(job.get("company") or "").strip()
@@ -816,16 +845,16 @@ class InterviewQuestionGenerator:
 
     @staticmethod
     def _load_guidelines(path: str) -> Dict[str, Any]:
-        base = dict(DEFAULT_GUIDELINES)
-        base["defaults"] = dict(DEFAULT_GUIDELINES["defaults"])
-        base["defaults"]["category_targets"] = dict(DEFAULT_GUIDELINES["defaults"]["category_targets"])
+        # load_json_config parses a private copy per call; the defaults are deep-copied so the merged
+        # result shares nothing with DEFAULT_GUIDELINES or with another generator.
+        base = copy.deepcopy(DEFAULT_GUIDELINES)
         if not path:
             return base
         file_path = Path(path)
         if not file_path.exists():
             return base
         try:
-            loaded = json.loads(file_path.read_text(encoding="utf-8"))
+            loaded = load_json_config(file_path)
         except Exception:
             return base
         if not isinstance(loaded, dict):
@@ -850,7 +879,7 @@ class InterviewQuestionGenerator:
         if not file_path.exists():
             return {}
         try:
-            loaded = json.loads(file_path.read_text(encoding="utf-8"))
+            loaded = load_json_config(file_path)
         except Exception:
             return {}
         return loaded if isinstance(loaded, dict) else {}
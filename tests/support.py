@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from typing import Any
+
+from tener_ai.agents import FAQAgent, OutreachAgent
+from tener_ai.db import Database
+from tener_ai.matching import MatchingEngine
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MATCHING_RULES_PATH = REPO_ROOT / "config" / "matching_rules.json"
+TEMPLATES_PATH = REPO_ROOT / "config" / "outreach_templates.json"
+# Durability is pointless for throwaway on-disk test databases; these trade it for fewer fsyncs per commit.
+FAST_TEST_PRAGMAS = """
+PRAGMA journal_mode=MEMORY;
+PRAGMA synchronous=OFF;
+PRAGMA temp_store=MEMORY;
+PRAGMA locking_mode=EXCLUSIVE;
+"""
+
+
+def apply_fast_test_pragmas(db: Any) -> Any:
+    with db.transaction() as conn:
+        conn.executescript(FAST_TEST_PRAGMAS).close()
+    return db
+
+
+class SchemaTemplateTestCase(unittest.TestCase):
+    """Runs the schema DDL once per class; each `_new_db()` is a private in-memory copy."""
+
+    database_class: Any = Database
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.schema_template = cls.database_class(":memory:")
+        cls.schema_template.init_schema()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.schema_template.close()
+        super().tearDownClass()
+
+    def _new_db(self) -> Any:
+        db = self.database_class(":memory:")
+        self.schema_template.clone_into(db)
+        return db
+
+
+class WorkflowAgentsTestCase(SchemaTemplateTestCase):
+    """Also builds the matching engine and template agents once per class; they only read their config."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.matching = MatchingEngine(str(MATCHING_RULES_PATH))
+        cls.outreach_agent = OutreachAgent(str(TEMPLATES_PATH), cls.matching)
+        cls.faq_agent = FAQAgent(str(TEMPLATES_PATH), cls.matching)
@@ -12,6 +12,8 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _Provider:
     def search_profiles(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -29,7 +31,7 @@ class _Provider:
 
 class AgentAssessmentsTests(unittest.TestCase):
     def test_candidate_contains_agent_scorecard_for_all_agent_roles(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "agent_assessments.sqlite3"))
             db.init_schema()
@@ -94,7 +96,7 @@ class AgentAssessmentsTests(unittest.TestCase):
             self.assertEqual(scorecard["interview_evaluation"].get("latest_status"), "not_started")
 
     def test_scores_are_na_before_candidate_dialogue_starts(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "agent_assessments_pre_dialogue.sqlite3"))
             db.init_schema()
@@ -154,7 +156,7 @@ class AgentAssessmentsTests(unittest.TestCase):
             self.assertIsNone(interview.get("latest_score"))
 
     def test_communication_score_varies_with_candidate_message_quality(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "agent_assessments_quality.sqlite3"))
             db.init_schema()
@@ -254,7 +256,7 @@ class AgentAssessmentsTests(unittest.TestCase):
             self.assertGreater(float(rich_score), float(short_score))
 
     def test_needs_resume_candidates_keep_distinct_raw_sourcing_scores(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "agent_assessments_needs_resume.sqlite3"))
             db.init_schema()
@@ -45,7 +45,7 @@ class ApiE2EScenariosTests(unittest.TestCase):
 
         self.server = ThreadingHTTPServer(("127.0.0.1", 0), api_main.TenerRequestHandler)
         self.base_url = f"http://127.0.0.1:{self.server.server_port}"
-        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
         self.server_thread.start()
 
     def tearDown(self) -> None:
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
+import io
 import json
 import os
-import threading
 import unittest
-from http.server import ThreadingHTTPServer
 from pathlib import Path
 from tempfile import TemporaryDirectory, gettempdir
+from types import SimpleNamespace
 from typing import Any, Dict, Optional, Tuple
-from urllib import error, request
+from unittest import mock
 
 # Prevent import-time default service bootstrap from writing inside repository runtime dir.
 os.environ.setdefault("TENER_DB_PATH", str(Path(gettempdir()) / "tener_auth_api_bootstrap.sqlite3"))
@@ -17,78 +17,107 @@ from tener_ai import main as api_main
 from tener_ai.auth import AuthRepository, AuthService
 from tener_ai.db import Database
 
+from tests.support import apply_fast_test_pragmas
 
-class AuthApiTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self._tmp = TemporaryDirectory()
-        tmp = Path(self._tmp.name)
-        self.db = Database(str(tmp / "auth_api.sqlite3"))
-        self.db.init_schema()
-        self.db.insert_job(
-            title="Auth Test Backend Engineer",
-            jd_text="Python, PostgreSQL, distributed systems",
-            location="Remote",
-            preferred_languages=["en"],
-            seniority="senior",
-        )
 
-        auth_repo = AuthRepository(
+class AuthApiTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # API keys are only read by these tests, so the auth bootstrap runs once per class.
+        cls._class_tmp = TemporaryDirectory()
+        cls.auth_repo = AuthRepository(
             backend="sqlite",
-            sqlite_path=str(tmp / "auth.sqlite3"),
+            sqlite_path=str(Path(cls._class_tmp.name) / "auth.sqlite3"),
         )
-        auth_repo.init_schema()
-        org_id = auth_repo.create_organization(name="Tener QA")
-        user_id = auth_repo.create_user(email="qa-admin@tener.local", full_name="QA Admin")
-        auth_repo.upsert_membership(org_id=org_id, user_id=user_id, role="admin", is_active=True)
-        self.read_token = auth_repo.create_api_key(
+        cls.auth_repo.init_schema()
+        org_id = cls.auth_repo.create_organization(name="Tener QA")
+        user_id = cls.auth_repo.create_user(email="qa-admin@tener.local", full_name="QA Admin")
+        cls.auth_repo.upsert_membership(org_id=org_id, user_id=user_id, role="admin", is_active=True)
+        cls.read_token = cls.auth_repo.create_api_key(
             org_id=org_id,
             user_id=user_id,
             name="Read Key",
             scopes=["api:read"],
         )["token"]
-        self.write_token = auth_repo.create_api_key(
+        cls.write_token = cls.auth_repo.create_api_key(
             org_id=org_id,
             user_id=user_id,
             name="Write Key",
             scopes=["api:write"],
         )["token"]
 
-        self._previous_services = api_main.SERVICES
-        api_main.SERVICES = {
-            "db": self.db,
-            "auth": AuthService(enabled=True, repository=auth_repo, legacy_admin_token=""),
-        }
+        # Mutate api_main.SERVICES in place once per class; patch.dict restores it even if a test aborts.
+        cls._services_patcher = mock.patch.dict(
+            api_main.SERVICES,
+            {"auth": AuthService(enabled=True, repository=cls.auth_repo, legacy_admin_token="")},
+            clear=True,
+        )
+        cls._services_patcher.start()
+        cls.addClassCleanup(cls._services_patcher.stop)
 
-        self.server = ThreadingHTTPServer(("127.0.0.1", 0), api_main.TenerRequestHandler)
-        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
-        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
-        self.server_thread.start()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._class_tmp.cleanup()
+
+    def setUp(self) -> None:
+        self._tmp = TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        self.db = apply_fast_test_pragmas(Database(str(tmp / "auth_api.sqlite3")))
+        self.db.init_schema()
+        self.db.insert_job(
+            title="Auth Test Backend Engineer",
+            jd_text="Python, PostgreSQL, distributed systems",
+            location="Remote",
+            preferred_languages=["en"],
+            seniority="senior",
+        )
+        api_main.SERVICES["db"] = self.db
 
     def tearDown(self) -> None:
-        self.server.shutdown()
-        self.server.server_close()
-        self.server_thread.join(timeout=3)
-        api_main.SERVICES = self._previous_services
         self._tmp.cleanup()
 
+    def _call(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, bytes]:
+        # Drive the handler directly over in-memory streams: no socket, server thread or urlopen.
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        lines = [f"{method} {path} HTTP/1.1", "Host: 127.0.0.1"]
+        for key, value in (headers or {}).items():
+            lines.append(f"{key}: {value}")
+        if body is not None:
+            lines.append("Content-Type: application/json")
+        lines.append(f"Content-Length: {len(payload)}")
+        raw_request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+        handler = api_main.TenerRequestHandler.__new__(api_main.TenerRequestHandler)
+        handler.server = SimpleNamespace(server_address=("127.0.0.1", 0), services=api_main.SERVICES)
+        handler.client_address = ("127.0.0.1", 0)
+        handler.request = None
+        handler.rfile = io.BytesIO(raw_request)
+        handler.wfile = io.BytesIO()
+        handler.close_connection = True
+        handler.handle_one_request()
+
+        head, _, raw_body = handler.wfile.getvalue().partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0]
+        return int(status_line.split(b" ", 2)[1]), raw_body
+
     def _request(self, method: str, path: str, token: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
         headers = {}
         if token:
             headers["Authorization"] = f"Bearer {token}"
-        req = request.Request(url=f"{self.base_url}{path}", method=method, headers=headers)
-        try:
-            with request.urlopen(req, timeout=20) as resp:
-                status = int(resp.status)
-                raw = resp.read().decode("utf-8")
-        except error.HTTPError as exc:
-            status = int(exc.code)
-            raw = exc.read().decode("utf-8")
+        status, raw = self._call(method, path, headers=headers)
         body: Dict[str, Any]
         if raw:
             try:
+                # json.loads detects UTF-8 bytes itself, so skip the separate decode pass.
                 body = json.loads(raw)
             except json.JSONDecodeError:
-                body = {"raw_text": raw}
+                body = {"raw_text": raw.decode("utf-8", errors="replace")}
         else:
             body = {}
         return status, body
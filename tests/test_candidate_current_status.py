@@ -11,6 +11,8 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+from tests.support import apply_fast_test_pragmas
+
 
 class _DeliveredProvider:
     def search_profiles(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -30,24 +32,37 @@ class _DeliveredProvider:
 
 
 class CandidateCurrentStatusTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Agents hold only parsed config and never touch the DB directly, so build them once per class.
+        cls.root = Path(__file__).resolve().parents[1]
+        cls.templates_path = str(cls.root / "config" / "outreach_templates.json")
+        matching = MatchingEngine(str(cls.root / "config" / "matching_rules.json"))
+        cls.sourcing_agent = SourcingAgent(_DeliveredProvider())  # type: ignore[arg-type]
+        cls.verification_agent = VerificationAgent(matching)
+        cls.outreach_agent = OutreachAgent(cls.templates_path, matching)
+        cls.faq_agent = FAQAgent(cls.templates_path, matching)
+
+    def _workflow(self, db: Database, **kwargs: Any) -> WorkflowService:
+        return WorkflowService(
+            db=db,
+            sourcing_agent=self.sourcing_agent,
+            verification_agent=self.verification_agent,
+            outreach_agent=self.outreach_agent,
+            faq_agent=self.faq_agent,
+            contact_all_mode=True,
+            require_resume_before_final_verify=True,
+            **kwargs,
+        )
+
     def test_candidate_status_progression_added_outreached_dialogue_cv_received(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
-            db = Database(str(Path(td) / "candidate_current_status.sqlite3"))
+            db = apply_fast_test_pragmas(Database(str(Path(td) / "candidate_current_status.sqlite3")))
             db.init_schema()
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
-            workflow = WorkflowService(
-                db=db,
-                sourcing_agent=SourcingAgent(_DeliveredProvider()),  # type: ignore[arg-type]
-                verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
-                pre_resume_service=PreResumeCommunicationService(
-                    templates_path=str(root / "config" / "outreach_templates.json")
-                ),
-                contact_all_mode=True,
-                require_resume_before_final_verify=True,
+            workflow = self._workflow(
+                db,
+                pre_resume_service=PreResumeCommunicationService(templates_path=self.templates_path),
                 stage_instructions={"pre_resume": "request cv and track status"},
             )
 
@@ -114,21 +129,11 @@ class CandidateCurrentStatusTests(unittest.TestCase):
             self.assertEqual(rows[0]["candidate_prescreen_status"], "cv_received_pending_answers")
 
     def test_candidate_status_marks_interview_passed_when_scored_above_threshold(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
-            db = Database(str(Path(td) / "candidate_interview_passed.sqlite3"))
+            db = apply_fast_test_pragmas(Database(str(Path(td) / "candidate_interview_passed.sqlite3")))
             db.init_schema()
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
-            workflow = WorkflowService(
-                db=db,
-                sourcing_agent=SourcingAgent(_DeliveredProvider()),  # type: ignore[arg-type]
-                verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
-                contact_all_mode=True,
-                require_resume_before_final_verify=True,
-            )
+            workflow = self._workflow(db)
 
             job_id = db.insert_job(
                 title="Senior Backend Engineer",
@@ -169,21 +174,11 @@ class CandidateCurrentStatusTests(unittest.TestCase):
             self.assertEqual(rows[0]["candidate_lifecycle_detail"], "Score 84.0")
 
     def test_candidate_ats_stage_marks_interview_failed_when_scored_below_threshold(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
-            db = Database(str(Path(td) / "candidate_interview_failed.sqlite3"))
+            db = apply_fast_test_pragmas(Database(str(Path(td) / "candidate_interview_failed.sqlite3")))
             db.init_schema()
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
-            workflow = WorkflowService(
-                db=db,
-                sourcing_agent=SourcingAgent(_DeliveredProvider()),  # type: ignore[arg-type]
-                verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
-                contact_all_mode=True,
-                require_resume_before_final_verify=True,
-            )
+            workflow = self._workflow(db)
 
             job_id = db.insert_job(
                 title="Senior Backend Engineer",
@@ -33,7 +33,7 @@ class CandidateLinkedinPublicUrlTests(unittest.TestCase):
                 "https://www.linkedin.com/in/ln-public-url-1",
             )
 
-            db.upsert_candidate(
+            updated_id = db.upsert_candidate(
                 {
                     "linkedin_id": "ln-public-url-1",
                     "full_name": "LinkedIn Public Url Candidate Updated",
@@ -46,7 +46,9 @@ class CandidateLinkedinPublicUrlTests(unittest.TestCase):
                 },
                 source="linkedin",
             )
+            self.assertEqual(updated_id, candidate_id)
             row_after = db.get_candidate(candidate_id)
+            self.assertEqual(str((row_after or {}).get("headline") or ""), "Staff Backend Engineer")
             self.assertEqual(
                 str((row_after or {}).get("linkedin_public_url") or ""),
                 "https://www.linkedin.com/in/ln-public-url-1",
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
+import os
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
-from tener_ai.candidate_scoring import CandidateScoringPolicy
+from tener_ai.candidate_scoring import DEFAULT_SCORING_POLICY, CandidateScoringPolicy
 
 
 class CandidateScoringPolicyTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.policy = CandidateScoringPolicy(path=None)
+    @classmethod
+    def setUpClass(cls) -> None:
+        # compute_overall is pure w.r.t. its inputs, so one policy serves every test.
+        cls.policy = CandidateScoringPolicy(path=None)
 
     @staticmethod
     def _scorecard(
@@ -106,5 +112,30 @@ class CandidateScoringPolicyTests(unittest.TestCase):
         self.assertLess(float(out.get("overall_score") or 0.0), 89.0)
 
 
+    def test_policies_do_not_share_payloads(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "scoring.json"
+            path.write_text(json.dumps({"version": "v1", "weights": {"communication": 0.5}}), encoding="utf-8")
+            first = CandidateScoringPolicy(path=str(path))
+            second = CandidateScoringPolicy(path=str(path))
+            first.payload["weights"]["communication"] = 0.9
+            self.assertEqual(second.payload["weights"]["communication"], 0.5)
+
+        default_policy = CandidateScoringPolicy(path=None)
+        default_policy.payload["weights"]["communication"] = 0.9
+        self.assertEqual(DEFAULT_SCORING_POLICY["weights"]["communication"], 0.20)
+
+    def test_reload_picks_up_same_size_edit_within_one_mtime_tick(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "scoring.json"
+            path.write_text(json.dumps({"version": "v1"}), encoding="utf-8")
+            policy = CandidateScoringPolicy(path=str(path))
+            stat = path.stat()
+            path.write_text(json.dumps({"version": "v2"}), encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            policy.reload()
+            self.assertEqual(policy.payload["version"], "v2")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,13 @@
+import re
+import threading
 import unittest
+import xml.etree.ElementTree as ET
+from dataclasses import replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Dict, List
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
 
 from tener_ai.company_culture_profile import (
     BingRssSearchProvider,
@@ -21,124 +27,122 @@ from tener_ai.company_culture_profile import (
 )
 
 
+_BASE_RESULTS: Tuple[SearchResult, ...] = (
+    SearchResult(
+        url="https://www.acme.ai/about?utm_source=google",
+        title="About Acme",
+        snippet="Mission and values",
+        rank=1,
+    ),
+    SearchResult(
+        url="https://www.acme.ai/careers",
+        title="Careers",
+        snippet="Culture and team",
+        rank=2,
+    ),
+    SearchResult(
+        url="https://boards.greenhouse.io/acmeai/jobs/4499111",
+        title="Senior Backend Engineer at Acme",
+        snippet="Role requirements and team culture",
+        rank=3,
+    ),
+    SearchResult(
+        url="https://jobs.lever.co/acmeai/abcd-1234",
+        title="Product Manager - Acme",
+        snippet="Qualifications and collaboration style",
+        rank=4,
+    ),
+    SearchResult(
+        url="https://www.glassdoor.com/Overview/Working-at-Acme",
+        title="Glassdoor",
+        snippet="Employee reviews",
+        rank=5,
+    ),
+    SearchResult(
+        url="https://www.linkedin.com/company/acme-ai/",
+        title="LinkedIn",
+        snippet="Company page",
+        rank=6,
+    ),
+)
+
+
 class _FakeSearchProvider:
     def search(self, query: str, limit: int) -> List[SearchResult]:
-        base = [
-            SearchResult(
-                url="https://www.acme.ai/about?utm_source=google",
-                title="About Acme",
-                snippet="Mission and values",
-                rank=1,
-            ),
-            SearchResult(
-                url="https://www.acme.ai/careers",
-                title="Careers",
-                snippet="Culture and team",
-                rank=2,
-            ),
-            SearchResult(
-                url="https://boards.greenhouse.io/acmeai/jobs/4499111",
-                title="Senior Backend Engineer at Acme",
-                snippet="Role requirements and team culture",
-                rank=3,
-            ),
-            SearchResult(
-                url="https://jobs.lever.co/acmeai/abcd-1234",
-                title="Product Manager - Acme",
-                snippet="Qualifications and collaboration style",
-                rank=4,
-            ),
-            SearchResult(
-                url="https://www.glassdoor.com/Overview/Working-at-Acme",
-                title="Glassdoor",
-                snippet="Employee reviews",
-                rank=5,
-            ),
-            SearchResult(
-                url="https://www.linkedin.com/company/acme-ai/",
-                title="LinkedIn",
-                snippet="Company page",
-                rank=6,
-            ),
-        ]
-        return base[:limit]
+        return list(_BASE_RESULTS[:limit])
+
+
+_FAKE_PAGES: Dict[str, FetchResponse] = {
+    "https://acme.ai/": FetchResponse(
+        url="https://acme.ai/",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body="<html><body>Acme official site. We value ownership, transparency, and customer obsession.</body></html>",
+    ),
+    "https://acme.ai/about": FetchResponse(
+        url="https://acme.ai/about",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body="<html><body>Our values: ownership, high standards, async collaboration, measurable impact.</body></html>",
+    ),
+    "https://acme.ai/careers": FetchResponse(
+        url="https://acme.ai/careers",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body="<html><body>We hire engineers who thrive in fast feedback loops and remote-first teams.</body></html>",
+    ),
+    "https://boards.greenhouse.io/acmeai/jobs/4499111": FetchResponse(
+        url="https://boards.greenhouse.io/acmeai/jobs/4499111",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body=(
+            "<html><body>"
+            "Senior Backend Engineer. Responsibilities: design scalable systems and partner cross-functional teams. "
+            "Requirements: 5+ years experience, strong communication, ownership mindset, code review discipline. "
+            "Our culture values transparency, collaboration, and customer impact."
+            "</body></html>"
+        ),
+    ),
+    "https://jobs.lever.co/acmeai/abcd-1234": FetchResponse(
+        url="https://jobs.lever.co/acmeai/abcd-1234",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body=(
+            "<html><body>"
+            "Product Manager role. We are looking for analytical, data-driven candidates with stakeholder management. "
+            "You will lead rapid iterations and work in a fast-paced, inclusive team."
+            "</body></html>"
+        ),
+    ),
+    "https://www.glassdoor.com/Overview/Working-at-Acme": FetchResponse(
+        url="https://www.glassdoor.com/Overview/Working-at-Acme",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body="<html><body>Review highlights mention autonomy and strong peer code reviews.</body></html>",
+    ),
+    "https://www.linkedin.com/company/acme-ai": FetchResponse(
+        url="https://www.linkedin.com/company/acme-ai",
+        status_code=200,
+        content_type="text/html; charset=utf-8",
+        body="<html><body>Acme builds B2B AI software and promotes continuous learning.</body></html>",
+    ),
+}
 
 
 class _FakePageFetcher:
     def fetch(self, url: str, timeout_seconds: int) -> FetchResponse:
-        payload: Dict[str, FetchResponse] = {
-            "https://acme.ai/": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body="<html><body>Acme official site. We value ownership, transparency, and customer obsession.</body></html>",
-            ),
-            "https://acme.ai/about": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body="<html><body>Our values: ownership, high standards, async collaboration, measurable impact.</body></html>",
-            ),
-            "https://acme.ai/careers": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body="<html><body>We hire engineers who thrive in fast feedback loops and remote-first teams.</body></html>",
-            ),
-            "https://boards.greenhouse.io/acmeai/jobs/4499111": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body=(
-                    "<html><body>"
-                    "Senior Backend Engineer. Responsibilities: design scalable systems and partner cross-functional teams. "
-                    "Requirements: 5+ years experience, strong communication, ownership mindset, code review discipline. "
-                    "Our culture values transparency, collaboration, and customer impact."
-                    "</body></html>"
-                ),
-            ),
-            "https://jobs.lever.co/acmeai/abcd-1234": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body=(
-                    "<html><body>"
-                    "Product Manager role. We are looking for analytical, data-driven candidates with stakeholder management. "
-                    "You will lead rapid iterations and work in a fast-paced, inclusive team."
-                    "</body></html>"
-                ),
-            ),
-            "https://www.glassdoor.com/Overview/Working-at-Acme": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body="<html><body>Review highlights mention autonomy and strong peer code reviews.</body></html>",
-            ),
-            "https://www.linkedin.com/company/acme-ai": FetchResponse(
-                url=url,
-                status_code=200,
-                content_type="text/html; charset=utf-8",
-                body="<html><body>Acme builds B2B AI software and promotes continuous learning.</body></html>",
-            ),
-        }
-        key = canonicalize_url(url)
-        if key in payload:
-            return payload[key]
+        page = _FAKE_PAGES.get(canonicalize_url(url))
+        if page is not None:
+            return replace(page, url=url)
         return FetchResponse(url=url, status_code=404, content_type="text/plain", body="not found")
 
 
+_FAKE_TAG_RE = re.compile(r"</?(?:html|body|p|br)\s*/?>", re.IGNORECASE)
+
+
 class _FakeExtractor:
     def extract_text(self, html: str, url: str) -> str:
-        return (
-            html.replace("<html>", " ")
-            .replace("</html>", " ")
-            .replace("<body>", " ")
-            .replace("</body>", " ")
-            .replace("<p>", " ")
-            .replace("</p>", " ")
-            .replace("<br>", " ")
-            .strip()
-        )
+        return _FAKE_TAG_RE.sub(" ", html).strip()
 
 
 class _FakeSynthesizer:
@@ -163,6 +167,24 @@ class _FailingSynthesizer:
 
 
 class CompanyCultureProfileTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The service keeps no per-call state, so the fake-backed pipelines are wired once per class.
+        cls.service = cls._build_service(synthesizer=_FakeSynthesizer())
+        cls.failing_llm_service = cls._build_service(synthesizer=_FailingSynthesizer())
+
+    @staticmethod
+    def _build_service(*, synthesizer: Any, page_fetcher: Optional[Any] = None) -> CompanyCultureProfileService:
+        return CompanyCultureProfileService(
+            search_provider=_FakeSearchProvider(),
+            page_fetcher=page_fetcher or _FakePageFetcher(),
+            content_extractor=_FakeExtractor(),
+            synthesizer=synthesizer,
+            max_links=10,
+            per_query_limit=4,
+            min_text_chars=20,
+        )
+
     def test_build_google_queries_includes_domain_and_culture_intent(self) -> None:
         queries = build_google_queries("Acme AI", "https://www.acme.ai")
         self.assertGreaterEqual(len(queries), 10)
@@ -203,16 +225,7 @@ class CompanyCultureProfileTests(unittest.TestCase):
         self.assertGreaterEqual(sum(1 for item in selected if is_job_board_url(item.url)), 2)
 
     def test_generate_profile_runs_full_pipeline(self) -> None:
-        service = CompanyCultureProfileService(
-            search_provider=_FakeSearchProvider(),
-            page_fetcher=_FakePageFetcher(),
-            content_extractor=_FakeExtractor(),
-            synthesizer=_FakeSynthesizer(),
-            max_links=10,
-            per_query_limit=4,
-            min_text_chars=20,
-        )
-        out = service.generate(company_name="Acme AI", website_url="https://www.acme.ai")
+        out = self.service.generate(company_name="Acme AI", website_url="https://www.acme.ai")
 
         self.assertEqual(out["company_name"], "Acme AI")
         self.assertEqual(out["website"], "https://acme.ai/")
@@ -229,17 +242,28 @@ class CompanyCultureProfileTests(unittest.TestCase):
         self.assertIn("who_should_avoid", out["profile"])
         self.assertEqual(out["warnings"], [])
 
-    def test_generate_profile_uses_heuristic_when_llm_fails(self) -> None:
-        service = CompanyCultureProfileService(
-            search_provider=_FakeSearchProvider(),
-            page_fetcher=_FakePageFetcher(),
-            content_extractor=_FakeExtractor(),
-            synthesizer=_FailingSynthesizer(),
-            max_links=10,
-            per_query_limit=4,
-            min_text_chars=20,
-        )
+    def test_generate_profile_fetches_pages_concurrently_and_keeps_order(self) -> None:
+        # Two fetches must be in flight at once to pass the barrier; a serial loop would time out.
+        barrier = threading.Barrier(2, timeout=5)
+        fetcher = _FakePageFetcher()
+
+        class _BarrierFetcher:
+            def fetch(self, url: str, timeout_seconds: int) -> FetchResponse:
+                if "greenhouse" in url or "lever" in url:
+                    barrier.wait()
+                return fetcher.fetch(url, timeout_seconds)
+
+        service = self._build_service(synthesizer=_FakeSynthesizer(), page_fetcher=_BarrierFetcher())
         out = service.generate(company_name="Acme AI", website_url="https://www.acme.ai")
+
+        urls = [item["url"] for item in out["sources"]]
+        self.assertEqual(urls[0], "https://acme.ai/")
+        self.assertIn("https://boards.greenhouse.io/acmeai/jobs/4499111", urls)
+        self.assertIn("https://jobs.lever.co/acmeai/abcd-1234", urls)
+        self.assertTrue(all(item["fetch_status"] != "fetch_failed" for item in out["sources"]))
+
+    def test_generate_profile_uses_heuristic_when_llm_fails(self) -> None:
+        out = self.failing_llm_service.generate(company_name="Acme AI", website_url="https://www.acme.ai")
         self.assertTrue(any("llm_synthesis_failed" in str(x) for x in out["warnings"]))
         self.assertIn("heuristic_fallback_active", out["warnings"])
         self.assertTrue((out["profile"] or {}).get("who_should_avoid"))
@@ -254,17 +278,13 @@ class CompanyCultureProfileTests(unittest.TestCase):
     def test_heuristic_synthesizer_returns_profile_shape(self) -> None:
         synthesizer = HeuristicCompanyProfileSynthesizer()
         sources = [
-            type(
-                "_Source",
-                (),
-                {
-                    "fetch_status": "ok",
-                    "extracted_text": "Remote-first collaboration and transparent communication with high ownership.",
-                    "domain": "acme.ai",
-                    "url": "https://acme.ai/",
-                    "title": "About",
-                },
-            )()
+            SimpleNamespace(
+                fetch_status="ok",
+                extracted_text="Remote-first collaboration and transparent communication with high ownership.",
+                domain="acme.ai",
+                url="https://acme.ai/",
+                title="About",
+            )
         ]
         profile = synthesizer.generate_profile("Acme AI", "https://acme.ai", sources)  # type: ignore[arg-type]
         self.assertIn("summary_200_300_words", profile)
@@ -313,9 +333,19 @@ class CompanyCultureProfileTests(unittest.TestCase):
         self.assertIn("Senior Backend Engineer", out[0].title)
 
     def test_is_job_board_url_detects_common_patterns(self) -> None:
-        self.assertTrue(is_job_board_url("https://boards.greenhouse.io/acme/jobs/123"))
-        self.assertTrue(is_job_board_url("https://acme.ai/careers/backend-engineer"))
-        self.assertFalse(is_job_board_url("https://acme.ai/about"))
+        cases = [
+            ("https://boards.greenhouse.io/acme/jobs/123", True),
+            ("https://acme.wd5.myworkdayjobs.com/en-US/External", True),
+            ("https://jobs.acme.ai/role/1", True),
+            ("https://acme.ai/careers/backend-engineer", True),
+            ("https://www.linkedin.com/jobs/view/123", True),
+            ("https://acme.ai/about", False),
+            ("https://clever.com/about", False),
+            ("", False),
+        ]
+        for url, expected in cases:
+            with self.subTest(url=url):
+                self.assertIs(is_job_board_url(url), expected)
 
     def test_bing_rss_parser_extracts_items(self) -> None:
         rss = """<?xml version="1.0" encoding="utf-8"?>
@@ -336,6 +366,46 @@ class CompanyCultureProfileTests(unittest.TestCase):
         self.assertEqual(out[0].url, "https://notion.so/careers")
         self.assertIn("Notion Careers", out[0].title)
 
+    def test_bing_rss_parser_honours_declared_feed_encoding(self) -> None:
+        rss = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            "<rss><channel><item><title>Café Careers</title>"
+            "<link>https://cafe.example/careers</link></item></channel></rss>"
+        ).encode("iso-8859-1")
+        out = BingRssSearchProvider._parse_results_from_rss(rss_xml=rss, query="cafe", limit=5)
+        self.assertEqual([x.title for x in out], ["Café Careers"])
+
+    def test_bing_rss_parser_keeps_items_before_malformed_tail(self) -> None:
+        rss = (
+            b"<rss><channel>"
+            b"<item><title>One</title><link>https://one.example/jobs</link></item>"
+            b"<item><title>Two</title><link>https://two.example/jobs</link></item>"
+            b"<item><title>Broken</title><link>https://three.example</oops>"
+        )
+        out = BingRssSearchProvider._parse_results_from_rss(rss_xml=rss, query="jobs", limit=10)
+        self.assertEqual([x.title for x in out], ["One", "Two"])
+
+    def test_bing_rss_parser_stops_feeding_once_limit_is_reached(self) -> None:
+        items = "".join(
+            f"<item><title>Item {i}</title><link>https://site{i}.example/jobs</link></item>" for i in range(200)
+        )
+        rss = f"<rss><channel>{items}</channel></rss>".encode("utf-8")
+        fed: List[int] = []
+
+        class _CountingPullParser(ET.XMLPullParser):
+            def feed(self, data: Any) -> None:
+                fed.append(len(data))
+                super().feed(data)
+
+        with mock.patch("tener_ai.company_culture_profile.RSS_FEED_CHUNK_SIZE", 256), mock.patch.object(
+            ET, "XMLPullParser", _CountingPullParser
+        ):
+            out = BingRssSearchProvider._parse_results_from_rss(rss_xml=rss, query="jobs", limit=3)
+
+        self.assertEqual([x.rank for x in out], [1, 2, 3])
+        self.assertEqual(out[-1].title, "Item 2")
+        self.assertLess(sum(fed), len(rss) // 10)
+
     def test_openai_synthesizer_loads_analysis_rules_from_file(self) -> None:
         with TemporaryDirectory() as td:
             path = Path(td) / "rules.md"
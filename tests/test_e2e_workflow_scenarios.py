@@ -1,43 +1,40 @@
 import json
 import unittest
-from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-from tener_ai.agents import FAQAgent, OutreachAgent, SourcingAgent, VerificationAgent
+from tener_ai.agents import SourcingAgent, VerificationAgent
 from tener_ai.db import Database
 from tener_ai.linkedin_provider import MockLinkedInProvider
-from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+from tests.support import REPO_ROOT, WorkflowAgentsTestCase
 
-class WorkflowE2EScenariosTests(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls) -> None:
-        cls.root = Path(__file__).resolve().parents[1]
-        scenarios_path = cls.root / "tests" / "scenarios" / "workflow_e2e_scenarios.json"
-        with scenarios_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        cls.scenarios = data["scenarios"]
 
-    def _build_workflow(self, work_dir: Path) -> Tuple[Database, WorkflowService]:
-        db = Database(str(work_dir / "workflow_e2e.sqlite3"))
-        db.init_schema()
+def _load_scenarios() -> List[Dict[str, Any]]:
+    scenarios_path = REPO_ROOT / "tests" / "scenarios" / "workflow_e2e_scenarios.json"
+    return json.loads(scenarios_path.read_bytes())["scenarios"]
+
 
-        matching = MatchingEngine(str(self.root / "config" / "matching_rules.json"))
-        provider = MockLinkedInProvider(str(self.root / "data" / "mock_linkedin_profiles.json"))
+# Loaded at import so each scenario can be attached as its own test method below.
+SCENARIOS = _load_scenarios()
 
-        sourcing = SourcingAgent(provider)
-        verification = VerificationAgent(matching)
-        outreach = OutreachAgent(str(self.root / "config" / "outreach_templates.json"), matching)
-        faq = FAQAgent(str(self.root / "config" / "outreach_templates.json"), matching)
 
+class WorkflowE2EScenariosTests(WorkflowAgentsTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        provider = MockLinkedInProvider(str(REPO_ROOT / "data" / "mock_linkedin_profiles.json"))
+        cls.sourcing_agent = SourcingAgent(provider)
+        cls.verification_agent = VerificationAgent(cls.matching)
+
+    def _build_workflow(self) -> Tuple[Database, WorkflowService]:
+        db = self._new_db()
         workflow = WorkflowService(
             db=db,
-            sourcing_agent=sourcing,
-            verification_agent=verification,
-            outreach_agent=outreach,
-            faq_agent=faq,
+            sourcing_agent=self.sourcing_agent,
+            verification_agent=self.verification_agent,
+            outreach_agent=self.outreach_agent,
+            faq_agent=self.faq_agent,
         )
         return db, workflow
 
@@ -62,68 +59,79 @@ class WorkflowE2EScenariosTests(unittest.TestCase):
             self.assertTrue(text, "human_explanation must be present for each candidate")
             self.assertIn("score", text.lower())
 
-    def test_manual_steps_match_expected_ranges(self) -> None:
-        for scenario in self.scenarios:
-            with self.subTest(scenario=scenario["id"]):
-                with TemporaryDirectory() as td:
-                    db, workflow = self._build_workflow(Path(td))
-                    job_id = self._insert_job(db, scenario["job"])
-                    expected = scenario["expected"]
-
-                    source = workflow.source_candidates(job_id=job_id, limit=scenario["source_limit"])
-                    self._assert_in_range(source["total"], expected["source_min"], expected["source_max"], "source total")
-
-                    verify = workflow.verify_profiles(job_id=job_id, profiles=source["profiles"])
-                    self._assert_in_range(verify["verified"], expected["verified_min"], expected["verified_max"], "verified total")
-                    self._assert_in_range(verify["rejected"], expected["rejected_min"], expected["rejected_max"], "rejected total")
-                    self._assert_human_explanations(verify["items"])
-
-                    verified_names = {
-                        str(item.get("profile", {}).get("full_name"))
-                        for item in verify["items"]
-                        if item.get("status") == "verified"
-                    }
-                    self.assertTrue(
-                        verified_names.intersection(set(expected["expected_verified_names"])),
-                        "expected verified candidate is missing",
-                    )
-
-                    verified_items = [x for x in verify["items"] if x.get("status") == "verified"]
-                    added = workflow.add_verified_candidates(job_id=job_id, verified_items=verified_items)
-                    self.assertEqual(added["total"], verify["verified"])
-
-                    outreach = workflow.outreach_candidates(
-                        job_id=job_id,
-                        candidate_ids=[x["candidate_id"] for x in added["added"]],
-                    )
-                    self.assertEqual(outreach["total"], added["total"])
-                    self.assertEqual(outreach["sent"], 0)  # Mock provider does not deliver direct messages.
-                    self.assertEqual(
-                        int(outreach["sent"]) + int(outreach.get("pending_connection", 0)) + int(outreach["failed"]),
-                        added["total"],
-                    )
+    def _run_scenario(self, scenario: Dict[str, Any]) -> None:
+        db, workflow = self._build_workflow()
+        job_id = self._insert_job(db, scenario["job"])
+        expected = scenario["expected"]
+
+        source = workflow.source_candidates(job_id=job_id, limit=scenario["source_limit"])
+        self._assert_in_range(source["total"], expected["source_min"], expected["source_max"], "source total")
+
+        verify = workflow.verify_profiles(job_id=job_id, profiles=source["profiles"])
+        self._assert_in_range(verify["verified"], expected["verified_min"], expected["verified_max"], "verified total")
+        self._assert_in_range(verify["rejected"], expected["rejected_min"], expected["rejected_max"], "rejected total")
+        self._assert_human_explanations(verify["items"])
+
+        verified_names = {
+            str(item.get("profile", {}).get("full_name"))
+            for item in verify["items"]
+            if item.get("status") == "verified"
+        }
+        self.assertTrue(
+            verified_names.intersection(set(expected["expected_verified_names"])),
+            "expected verified candidate is missing",
+        )
+
+        verified_items = [x for x in verify["items"] if x.get("status") == "verified"]
+        added = workflow.add_verified_candidates(job_id=job_id, verified_items=verified_items)
+        self.assertEqual(added["total"], verify["verified"])
+
+        outreach = workflow.outreach_candidates(
+            job_id=job_id,
+            candidate_ids=[x["candidate_id"] for x in added["added"]],
+        )
+        self.assertEqual(outreach["total"], added["total"])
+        self.assertEqual(outreach["sent"], 0)  # Mock provider does not deliver direct messages.
+        self.assertEqual(
+            int(outreach["sent"]) + int(outreach.get("pending_connection", 0)) + int(outreach["failed"]),
+            added["total"],
+        )
 
     def test_full_workflow_and_faq_reply_language(self) -> None:
         # Frontend ES scenario gives an ES-speaking verified candidate (Miguel Santos).
-        scenario = next(x for x in self.scenarios if x["id"] == "frontend_typescript_spain")
-        with TemporaryDirectory() as td:
-            db, workflow = self._build_workflow(Path(td))
-            job_id = self._insert_job(db, scenario["job"])
-
-            summary = workflow.execute_job_workflow(job_id=job_id, limit=scenario["source_limit"])
-            self._assert_in_range(summary.searched, 8, 10, "summary searched")
-            self._assert_in_range(summary.verified, 1, 2, "summary verified")
-            self.assertEqual(summary.outreached, len(summary.conversation_ids))
-            self.assertGreaterEqual(len(summary.conversation_ids), 1)
-
-            conversation_id = summary.conversation_ids[0]
-            reply = workflow.process_inbound_message(
-                conversation_id=conversation_id,
-                text="Hola, cual es el salario y el proceso?",
-            )
-            self.assertEqual(reply["language"], "es")
-            self.assertIn(reply["intent"], {"salary", "timeline", "default"})
-            self.assertTrue(reply["reply"].strip())
+        scenario = next(x for x in SCENARIOS if x["id"] == "frontend_typescript_spain")
+        db, workflow = self._build_workflow()
+        job_id = self._insert_job(db, scenario["job"])
+
+        summary = workflow.execute_job_workflow(job_id=job_id, limit=scenario["source_limit"])
+        self._assert_in_range(summary.searched, 8, 10, "summary searched")
+        self._assert_in_range(summary.verified, 1, 2, "summary verified")
+        self.assertEqual(summary.outreached, len(summary.conversation_ids))
+        self.assertGreaterEqual(len(summary.conversation_ids), 1)
+
+        conversation_id = summary.conversation_ids[0]
+        reply = workflow.process_inbound_message(
+            conversation_id=conversation_id,
+            text="Hola, cual es el salario y el proceso?",
+        )
+        self.assertEqual(reply["language"], "es")
+        self.assertIn(reply["intent"], {"salary", "timeline", "default"})
+        self.assertTrue(reply["reply"].strip())
+
+
+def _scenario_test(scenario: Dict[str, Any]) -> Callable[[WorkflowE2EScenariosTests], None]:
+    def test(self: WorkflowE2EScenariosTests) -> None:
+        self._run_scenario(scenario)
+    return test
+
+
+def _attach_scenario_tests(scenarios: List[Dict[str, Any]]) -> None:
+    # One test method per scenario keeps failures attributed per scenario and lets runners schedule them independently.
+    for scenario in scenarios:
+        setattr(WorkflowE2EScenariosTests, f"test_scenario_{scenario['id']}", _scenario_test(scenario))
+
+
+_attach_scenario_tests(SCENARIOS)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import threading
@@ -8,7 +9,6 @@ from http.server import ThreadingHTTPServer
 from pathlib import Path
 from tempfile import TemporaryDirectory, gettempdir
 from typing import Any, Dict, Optional, Tuple
-from urllib import error, request
 
 # Prevent import-time default service bootstrap from writing inside repository runtime dir.
 os.environ.setdefault("TENER_DB_PATH", str(Path(gettempdir()) / "tener_emulator_bootstrap.sqlite3"))
@@ -16,16 +16,14 @@ os.environ.setdefault("TENER_DB_PATH", str(Path(gettempdir()) / "tener_emulator_
 from tener_ai import main as api_main
 from tener_ai.emulator.store import EmulatorProjectStore
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
 
-class EmulatorStoreTests(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls) -> None:
-        cls.root = Path(__file__).resolve().parents[1]
 
+class EmulatorStoreTests(unittest.TestCase):
     def test_load_real_config_projects_and_profiles(self) -> None:
         store = EmulatorProjectStore(
-            projects_dir=self.root / "config" / "emulator" / "projects",
-            company_profiles_path=self.root / "config" / "emulator" / "company_profiles.json",
+            projects_dir=REPO_ROOT / "config" / "emulator" / "projects",
+            company_profiles_path=REPO_ROOT / "config" / "emulator" / "company_profiles.json",
         )
         health = store.health()
         self.assertEqual(health["status"], "ok")
@@ -45,59 +43,68 @@ class EmulatorStoreTests(unittest.TestCase):
         self.assertEqual(str(profile.get("domain")), "stripe.com")
 
     def test_invalid_project_marks_store_as_degraded(self) -> None:
-        with TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            projects_dir = tmp_path / "projects"
-            projects_dir.mkdir(parents=True, exist_ok=True)
-            (projects_dir / "bad.json").write_text('{"id":"x"}', encoding="utf-8")
-
-            profiles_path = tmp_path / "profiles.json"
-            profiles_path.write_text(
-                json.dumps(
+        profiles_json = json.dumps(
+            {
+                "profiles": [
                     {
-                        "profiles": [
-                            {
-                                "id": "ok",
-                                "name": "Ok Inc",
-                                "domain": "ok.inc",
-                                "summary": "ok",
-                                "profile": {"values": ["one"]},
-                            }
-                        ]
+                        "id": "ok",
+                        "name": "Ok Inc",
+                        "domain": "ok.inc",
+                        "summary": "ok",
+                        "profile": {"values": ["one"]},
                     }
-                ),
-                encoding="utf-8",
+                ]
+            }
+        ).encode("utf-8")
+
+        store = EmulatorProjectStore.from_raw({"bad.json": b'{"id":"x"}'}, profiles_json)
+        health = store.health()
+        self.assertEqual(health["status"], "degraded")
+        self.assertIn("bad.json", str(health.get("load_error") or ""))
+        self.assertEqual(store.list_projects(), [])
+        self.assertIsNotNone(store.get_company_profile("ok.inc"))
+
+    def test_reload_picks_up_edited_company_profiles(self) -> None:
+        with TemporaryDirectory() as tmp:
+            profiles_path = Path(tmp) / "profiles.json"
+            profile = {"id": "ok", "name": "Ok Inc", "domain": "ok.inc", "profile": {}}
+            profiles_path.write_text(json.dumps({"profiles": [profile]}), encoding="utf-8")
+
+            store = EmulatorProjectStore(
+                projects_dir=REPO_ROOT / "config" / "emulator" / "projects",
+                company_profiles_path=profiles_path,
             )
+            self.assertEqual(store.health()["company_profile_count"], 1)
 
-            store = EmulatorProjectStore(projects_dir=projects_dir, company_profiles_path=profiles_path)
-            health = store.health()
-            self.assertEqual(health["status"], "degraded")
-            self.assertIn("bad.json", str(health.get("load_error") or ""))
-            self.assertEqual(store.list_projects(), [])
+            other = {"id": "other", "name": "Other Ltd", "domain": "other.ltd", "profile": {}}
+            profiles_path.write_text(json.dumps({"profiles": [profile, other]}), encoding="utf-8")
+            self.assertEqual(store.reload()["company_profile_count"], 2)
+            self.assertIsNotNone(store.get_company_profile("other.ltd"))
 
 
 class EmulatorApiTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.root = Path(__file__).resolve().parents[1]
+        cls.store = EmulatorProjectStore(
+            projects_dir=REPO_ROOT / "config" / "emulator" / "projects",
+            company_profiles_path=REPO_ROOT / "config" / "emulator" / "company_profiles.json",
+        )
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), api_main.TenerRequestHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
 
     def setUp(self) -> None:
         self._previous_services = api_main.SERVICES
-        self.store = EmulatorProjectStore(
-            projects_dir=self.root / "config" / "emulator" / "projects",
-            company_profiles_path=self.root / "config" / "emulator" / "company_profiles.json",
-        )
         api_main.SERVICES = {"emulator_store": self.store}
-
-        self.server = ThreadingHTTPServer(("127.0.0.1", 0), api_main.TenerRequestHandler)
-        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
-        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
-        self.server_thread.start()
+        self.conn = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=20)
 
     def tearDown(self) -> None:
-        self.server.shutdown()
-        self.server.server_close()
-        self.server_thread.join(timeout=3)
+        self.conn.close()
         api_main.SERVICES = self._previous_services
 
     def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, Any], str]:
@@ -107,14 +114,10 @@ class EmulatorApiTests(unittest.TestCase):
             headers["Content-Type"] = "application/json"
             data = json.dumps(payload).encode("utf-8")
 
-        req = request.Request(url=f"{self.base_url}{path}", method=method, headers=headers, data=data)
-        try:
-            with request.urlopen(req, timeout=20) as resp:
-                status = int(resp.status)
-                text = resp.read().decode("utf-8")
-        except error.HTTPError as exc:
-            status = int(exc.code)
-            text = exc.read().decode("utf-8")
+        self.conn.request(method, path, body=data, headers=headers)
+        resp = self.conn.getresponse()
+        status = int(resp.status)
+        text = resp.read().decode("utf-8")
 
         if text:
             try:
@@ -1,23 +1,121 @@
 from __future__ import annotations
 
 import unittest
+from collections import deque
 from typing import Any, Dict, Optional
 
 from tener_interview.providers import HireflixConfig
 from tener_interview.providers.hireflix_http import HireflixHTTPAdapter
 
 
+# Scripted GraphQL payloads are built once; the adapter only reads them.
+def _invite_response(interview_id: str, hash_value: str) -> Dict[str, Any]:
+    return {
+        "data": {
+            "inviteCandidateToInterview": {
+                "__typename": "InterviewType",
+                "id": interview_id,
+                "hash": hash_value,
+                "url": {"public": f"https://app.hireflix.com/{hash_value}"},
+            }
+        }
+    }
+
+
+def _pending_interview_response(interview_id: str, hash_value: str, email: str) -> Dict[str, Any]:
+    return {
+        "data": {
+            "interview": {
+                "id": interview_id,
+                "status": "pending",
+                "hash": hash_value,
+                "url": {"public": f"https://app.hireflix.com/{hash_value}"},
+                "candidate": {"email": email},
+            }
+        }
+    }
+
+
+_RESP_POSITION_SAVE = {"data": {"Position": {"save": {"id": "pos_new_1", "name": "Acme Interview"}}}}
+_RESP_INVITE_INT_1 = _invite_response("int_1", "hash_1")
+_RESP_INTERVIEW_INT_1 = _pending_interview_response("int_1", "hash_1", "jane@example.com")
+_RESP_INVITE_NAME_FIX = _invite_response("int_name_fix", "hash_name_fix")
+_RESP_INTERVIEW_NAME_FIX = _pending_interview_response("int_name_fix", "hash_name_fix", "candidate@example.com")
+_RESP_INVITE_INT_2 = _invite_response("int_2", "hash_2")
+_RESP_INTERVIEW_INT_2 = _pending_interview_response("int_2", "hash_2", "jane@example.com")
+_RESP_INVITE_EXCEEDED = {"data": {"inviteCandidateToInterview": {"__typename": "ExceededInvitesThisPeriodError"}}}
+_RESP_INVITE_EXCEEDED_DETAILED = {
+    "data": {
+        "inviteCandidateToInterview": {
+            "__typename": "ExceededInvitesThisPeriodError",
+            "code": 403,
+            "name": "ExceededInvitesThisPeriodError",
+            "message": "Accessing Mutation.inviteCandidateToInterview requires an active subscription",
+        }
+    }
+}
+_RESP_LEGACY_INVITE = {
+    "data": {
+        "Position": {
+            "invite": {
+                "id": "int_legacy",
+                "hash": "hash_l",
+                "url": {"public": "https://app.hireflix.com/hash_l"},
+            }
+        }
+    }
+}
+_RESP_LEGACY_INTERVIEW = {
+    "data": {
+        "interview": {
+            "id": "int_legacy",
+            "status": "pending",
+            "hash": "hash_l",
+            "url": {"public": "https://app.hireflix.com/hash_l"},
+        }
+    }
+}
+_RESP_STATUS_PENDING = {"data": {"interview": {"id": "int_1", "status": "pending", "answered": False, "hash": "h1"}}}
+_RESP_STATUS_COMPLETED = {"data": {"interview": {"id": "int_2", "status": "completed", "answered": True, "hash": "h2"}}}
+_RESP_RESULT_SCORED = {
+    "data": {
+        "interview": {
+            "id": "int_1",
+            "status": "completed",
+            "score": {"value": 82},
+            "questions": [
+                {"id": "q1", "title": "Python", "answer": {"id": "a1"}},
+                {"id": "q2", "title": "Communication", "answer": {"id": "a2"}},
+            ],
+        }
+    }
+}
+_RESP_RESULT_UNSCORED = {
+    "data": {
+        "interview": {
+            "id": "int_1",
+            "status": "completed",
+            "score": {"value": None},
+            "questions": [
+                {"id": "q1", "title": "Question 1", "answer": {"id": "a1"}},
+                {"id": "q2", "title": "Question 2", "answer": {}},
+            ],
+        }
+    }
+}
+
+
 class _FakeAdapter(HireflixHTTPAdapter):
     def __init__(self, config: HireflixConfig, scripted_responses: list[Dict[str, Any]]) -> None:
         super().__init__(config)
-        self.scripted = list(scripted_responses)
+        self.scripted = deque(scripted_responses)
         self.calls: list[Dict[str, Any]] = []
 
     def _graphql(self, *, query: str, variables: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         self.calls.append({"query": query, "variables": variables})
         if not self.scripted:
             raise ValueError("no scripted response")
-        return self.scripted.pop(0)
+        return self.scripted.popleft()
 
 
 class HireflixHttpAdapterTests(unittest.TestCase):
@@ -40,18 +138,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_create_assessment_with_position_save_mutation(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id=""),
-            scripted_responses=[
-                {
-                    "data": {
-                        "Position": {
-                            "save": {
-                                "id": "pos_new_1",
-                                "name": "Acme Interview",
-                            }
-                        }
-                    }
-                }
-            ],
+            scripted_responses=[_RESP_POSITION_SAVE],
         )
 
         out = adapter.create_assessment(
@@ -77,29 +164,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_create_invitation_with_new_mutation(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "inviteCandidateToInterview": {
-                            "__typename": "InterviewType",
-                            "id": "int_1",
-                            "hash": "hash_1",
-                            "url": {"public": "https://app.hireflix.com/hash_1"},
-                        }
-                    }
-                },
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_1",
-                            "status": "pending",
-                            "hash": "hash_1",
-                            "url": {"public": "https://app.hireflix.com/hash_1"},
-                            "candidate": {"email": "jane@example.com"},
-                        }
-                    }
-                },
-            ],
+            scripted_responses=[_RESP_INVITE_INT_1, _RESP_INTERVIEW_INT_1],
         )
 
         out = adapter.create_invitation(
@@ -120,29 +185,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_create_invitation_defaults_last_name_for_single_token_name(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "inviteCandidateToInterview": {
-                            "__typename": "InterviewType",
-                            "id": "int_name_fix",
-                            "hash": "hash_name_fix",
-                            "url": {"public": "https://app.hireflix.com/hash_name_fix"},
-                        }
-                    }
-                },
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_name_fix",
-                            "status": "pending",
-                            "hash": "hash_name_fix",
-                            "url": {"public": "https://app.hireflix.com/hash_name_fix"},
-                            "candidate": {"email": "candidate@example.com"},
-                        }
-                    }
-                },
-            ],
+            scripted_responses=[_RESP_INVITE_NAME_FIX, _RESP_INTERVIEW_NAME_FIX],
         )
 
         out = adapter.create_invitation(
@@ -160,29 +203,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_create_invitation_with_explicit_external_id(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "inviteCandidateToInterview": {
-                            "__typename": "InterviewType",
-                            "id": "int_2",
-                            "hash": "hash_2",
-                            "url": {"public": "https://app.hireflix.com/hash_2"},
-                        }
-                    }
-                },
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_2",
-                            "status": "pending",
-                            "hash": "hash_2",
-                            "url": {"public": "https://app.hireflix.com/hash_2"},
-                            "candidate": {"email": "jane@example.com"},
-                        }
-                    }
-                },
-            ],
+            scripted_responses=[_RESP_INVITE_INT_2, _RESP_INTERVIEW_INT_2],
         )
 
         out = adapter.create_invitation(
@@ -200,30 +221,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_create_invitation_falls_back_to_legacy_mutation(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1", allow_legacy_invite_fallback=True),
-            scripted_responses=[
-                {"data": {"inviteCandidateToInterview": {"__typename": "ExceededInvitesThisPeriodError"}}},
-                {
-                    "data": {
-                        "Position": {
-                            "invite": {
-                                "id": "int_legacy",
-                                "hash": "hash_l",
-                                "url": {"public": "https://app.hireflix.com/hash_l"},
-                            }
-                        }
-                    }
-                },
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_legacy",
-                            "status": "pending",
-                            "hash": "hash_l",
-                            "url": {"public": "https://app.hireflix.com/hash_l"},
-                        }
-                    }
-                },
-            ],
+            scripted_responses=[_RESP_INVITE_EXCEEDED, _RESP_LEGACY_INVITE, _RESP_LEGACY_INTERVIEW],
         )
 
         out = adapter.create_invitation(
@@ -239,18 +237,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_create_invitation_without_legacy_fallback_raises_new_error(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1", allow_legacy_invite_fallback=False),
-            scripted_responses=[
-                {
-                    "data": {
-                        "inviteCandidateToInterview": {
-                            "__typename": "ExceededInvitesThisPeriodError",
-                            "code": 403,
-                            "name": "ExceededInvitesThisPeriodError",
-                            "message": "Accessing Mutation.inviteCandidateToInterview requires an active subscription",
-                        }
-                    }
-                },
-            ],
+            scripted_responses=[_RESP_INVITE_EXCEEDED_DETAILED],
         )
 
         with self.assertRaises(ValueError) as ctx:
@@ -266,36 +253,14 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_status_mapping(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_1",
-                            "status": "pending",
-                            "answered": False,
-                            "hash": "h1",
-                        }
-                    }
-                }
-            ],
+            scripted_responses=[_RESP_STATUS_PENDING],
         )
         out = adapter.get_interview_status("int_1")
         self.assertEqual(out["status"], "invited")
 
         adapter2 = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_2",
-                            "status": "completed",
-                            "answered": True,
-                            "hash": "h2",
-                        }
-                    }
-                }
-            ],
+            scripted_responses=[_RESP_STATUS_COMPLETED],
         )
         out2 = adapter2.get_interview_status("int_2")
         self.assertEqual(out2["status"], "completed")
@@ -303,21 +268,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_result_uses_global_score_for_dimensions(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_1",
-                            "status": "completed",
-                            "score": {"value": 82},
-                            "questions": [
-                                {"id": "q1", "title": "Python", "answer": {"id": "a1"}},
-                                {"id": "q2", "title": "Communication", "answer": {"id": "a2"}},
-                            ],
-                        }
-                    }
-                }
-            ],
+            scripted_responses=[_RESP_RESULT_SCORED],
         )
 
         out = adapter.get_interview_result("int_1")
@@ -328,21 +279,7 @@ class HireflixHttpAdapterTests(unittest.TestCase):
     def test_result_fallback_from_completion_ratio(self) -> None:
         adapter = _FakeAdapter(
             HireflixConfig(api_key="k", position_id="pos_1"),
-            scripted_responses=[
-                {
-                    "data": {
-                        "interview": {
-                            "id": "int_1",
-                            "status": "completed",
-                            "score": {"value": None},
-                            "questions": [
-                                {"id": "q1", "title": "Question 1", "answer": {"id": "a1"}},
-                                {"id": "q2", "title": "Question 2", "answer": {}},
-                            ],
-                        }
-                    }
-                }
-            ],
+            scripted_responses=[_RESP_RESULT_UNSCORED],
         )
 
         out = adapter.get_interview_result("int_1")
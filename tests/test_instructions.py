@@ -41,6 +41,23 @@ class AgentInstructionsTests(unittest.TestCase):
             self.assertEqual(book.get("faq"), "faq-2")
             self.assertEqual(book.to_dict()["version"], "v2")
 
+    def test_reload_reads_updated_referenced_file(self) -> None:
+        with TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "faq.md").write_text("faq-1", encoding="utf-8")
+            path = root / "instructions.json"
+            path.write_text(
+                json.dumps({"agents": {"faq": {"file": "faq.md"}, "outreach": {"file": "faq.md"}}}),
+                encoding="utf-8",
+            )
+            book = AgentInstructions(str(path))
+            self.assertEqual(book.get("outreach"), "faq-1")
+
+            (root / "faq.md").write_text("faq-2", encoding="utf-8")
+            book.reload()
+            self.assertEqual(book.get("faq"), "faq-2")
+            self.assertEqual(book.get("outreach"), "faq-2")
+
     def test_loads_instruction_from_relative_file_reference(self) -> None:
         with TemporaryDirectory() as td:
             root = Path(td)
@@ -92,6 +109,8 @@ class AgentEvaluationPlaybookTests(unittest.TestCase):
             self.assertEqual(book.get_agent_name("communication"), "Candidate Communication Agent")
             self.assertEqual(book.get_instruction("communication", "outreach"), "outreach eval instruction")
             self.assertEqual(book.get_instruction("communication", "dialogue"), "fallback instruction")
+            self.assertEqual(book.get_instruction("communication"), "fallback instruction")
+            self.assertEqual(book.get_instruction("unknown", "outreach", fallback="none"), "none")
             self.assertEqual(book.to_dict()["version"], "eval-v1")
 
     def test_supports_file_reference_in_stage_instruction(self) -> None:
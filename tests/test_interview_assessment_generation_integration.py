@@ -84,74 +84,82 @@ class _AssessmentAwareProvider:
 
 
 class InterviewAssessmentGenerationIntegrationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Guideline and company profile files are read-only inputs; write them once for the class.
+        cls._fixtures_dir = TemporaryDirectory()
+        fixtures = Path(cls._fixtures_dir.name)
+        cls.guidelines_path = fixtures / "guidelines.json"
+        cls.profile_path = fixtures / "company_profile.json"
+        cls.guidelines_path.write_text(
+            json.dumps(
+                {
+                    "version": "test-v1",
+                    "defaults": {
+                        "question_count": 3,
+                        "time_to_answer": 120,
+                        "time_to_think": 10,
+                        "retakes": 1,
+                    },
+                    "skill_dictionary": ["python", "aws", "sql", "java", "kubernetes"],
+                }
+            ),
+            encoding="utf-8",
+        )
+        cls.profile_path.write_text(
+            json.dumps(
+                {
+                    "mission": "Build better teams",
+                    "values": ["communication", "ownership"],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._fixtures_dir.cleanup()
+
     def test_assessment_is_reused_per_job_and_regenerated_when_jd_changes(self) -> None:
-        with TemporaryDirectory() as tmpdir:
-            db = InterviewDatabase(str(Path(tmpdir) / "interview.sqlite3"))
-            db.init_schema()
-
-            guidelines_path = Path(tmpdir) / "guidelines.json"
-            profile_path = Path(tmpdir) / "company_profile.json"
-            guidelines_path.write_text(
-                json.dumps(
-                    {
-                        "version": "test-v1",
-                        "defaults": {
-                            "question_count": 3,
-                            "time_to_answer": 120,
-                            "time_to_think": 10,
-                            "retakes": 1,
-                        },
-                        "skill_dictionary": ["python", "aws", "sql", "java", "kubernetes"],
-                    }
-                ),
-                encoding="utf-8",
-            )
-            profile_path.write_text(
-                json.dumps(
-                    {
-                        "mission": "Build better teams",
-                        "values": ["communication", "ownership"],
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            source = _MutableSourceCatalog()
-            provider = _AssessmentAwareProvider()
-            generator = InterviewQuestionGenerator(
-                guidelines_path=str(guidelines_path),
-                company_profile_path=str(profile_path),
-                company_name="Tener",
-            )
-
-            service = InterviewService(
-                db=db,
-                provider=provider,
-                token_service=InterviewTokenService(secret="secret"),
-                scoring_engine=InterviewScoringEngine(),
-                source_catalog=source,
-                question_generator=generator,
-                default_ttl_hours=72,
-                public_base_url="http://localhost:8090",
-            )
-
-            first = service.start_session(job_id=1, candidate_id=101, candidate_name="C1")
-            second = service.start_session(job_id=1, candidate_id=102, candidate_name="C2")
-
-            self.assertEqual(provider.assessment_count, 1)
-            self.assertEqual(first["provider"]["assessment_id"], "pos_1")
-            self.assertEqual(second["provider"]["assessment_id"], "pos_1")
-
-            source.jd_text = "Java and Kubernetes platform engineering"
-            third = service.start_session(job_id=1, candidate_id=103, candidate_name="C3")
-
-            self.assertEqual(provider.assessment_count, 2)
-            self.assertEqual(third["provider"]["assessment_id"], "pos_2")
-
-            saved = db.get_job_assessment(1)
-            self.assertIsNotNone(saved)
-            assert saved is not None
-            self.assertEqual(saved["provider_assessment_id"], "pos_2")
+        db = InterviewDatabase(":memory:")
+        db.init_schema()
+
+        source = _MutableSourceCatalog()
+        provider = _AssessmentAwareProvider()
+        generator = InterviewQuestionGenerator(
+            guidelines_path=str(self.guidelines_path),
+            company_profile_path=str(self.profile_path),
+            company_name="Tener",
+        )
+
+        service = InterviewService(
+            db=db,
+            provider=provider,
+            token_service=InterviewTokenService(secret="secret"),
+            scoring_engine=InterviewScoringEngine(),
+            source_catalog=source,
+            question_generator=generator,
+            default_ttl_hours=72,
+            public_base_url="http://localhost:8090",
+        )
+
+        first = service.start_session(job_id=1, candidate_id=101, candidate_name="C1")
+        second = service.start_session(job_id=1, candidate_id=102, candidate_name="C2")
+
+        self.assertEqual(provider.assessment_count, 1)
+        self.assertEqual(first["provider"]["assessment_id"], "pos_1")
+        self.assertEqual(second["provider"]["assessment_id"], "pos_1")
+
+        source.jd_text = "Java and Kubernetes platform engineering"
+        third = service.start_session(job_id=1, candidate_id=103, candidate_name="C3")
+
+        self.assertEqual(provider.assessment_count, 2)
+        self.assertEqual(third["provider"]["assessment_id"], "pos_2")
+
+        saved = db.get_job_assessment(1)
+        self.assertIsNotNone(saved)
+        assert saved is not None
+        self.assertEqual(saved["provider_assessment_id"], "pos_2")
 
 
 if __name__ == "__main__":
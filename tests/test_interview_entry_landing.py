@@ -6,7 +6,7 @@ import unittest
 from datetime import datetime, timezone
 from http.server import ThreadingHTTPServer
 from pathlib import Path
-from tempfile import TemporaryDirectory, gettempdir
+from tempfile import gettempdir
 from types import SimpleNamespace
 from urllib import error, request
 from urllib.parse import urlparse
@@ -51,9 +51,7 @@ class _NoRedirectHandler(request.HTTPRedirectHandler):
 
 class InterviewEntryLandingTests(unittest.TestCase):
     def setUp(self) -> None:
-        self.tmp = TemporaryDirectory()
-        db_path = str(Path(self.tmp.name) / "interview.sqlite3")
-        self.db = InterviewDatabase(db_path=db_path)
+        self.db = InterviewDatabase(db_path=":memory:")
         self.db.init_schema()
         self.provider = HireflixMockAdapter()
         self.service = InterviewService(
@@ -67,7 +65,7 @@ class InterviewEntryLandingTests(unittest.TestCase):
         )
 
     def tearDown(self) -> None:
-        self.tmp.cleanup()
+        self.db._conn.close()
 
     def test_entry_landing_preview_keeps_session_invited(self) -> None:
         started = self.service.start_session(
@@ -113,7 +111,7 @@ class InterviewEntryLandingTests(unittest.TestCase):
         }
         server = ThreadingHTTPServer(("127.0.0.1", 0), http_api.InterviewRequestHandler)
         base_url = f"http://127.0.0.1:{server.server_port}"
-        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
         server_thread.start()
 
         try:
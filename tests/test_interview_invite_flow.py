@@ -2,16 +2,14 @@ from __future__ import annotations
 
 import unittest
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any, Dict, List
 
-from tener_ai.agents import FAQAgent, OutreachAgent, SourcingAgent, VerificationAgent
-from tener_ai.db import Database
-from tener_ai.matching import MatchingEngine
+from tener_ai.agents import SourcingAgent, VerificationAgent
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+from tests.support import TEMPLATES_PATH, WorkflowAgentsTestCase
+
 
 class _LinkedInProvider:
     def __init__(self) -> None:
@@ -84,191 +82,183 @@ class _InterviewClient:
         return self.refresh_session(session_id=session_id, force=False)
 
 
-class InterviewInviteFlowTests(unittest.TestCase):
+class InterviewInviteFlowTests(WorkflowAgentsTestCase):
     def test_cv_and_answers_trigger_interview_link_and_followup(self) -> None:
-        root = Path(__file__).resolve().parents[1]
-        with TemporaryDirectory() as td:
-            db = Database(str(Path(td) / "interview_invite.sqlite3"))
-            db.init_schema()
-
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
-            provider = _LinkedInProvider()
-            interview = _InterviewClient()
-            workflow = WorkflowService(
-                db=db,
-                sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
-                verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
-                pre_resume_service=PreResumeCommunicationService(templates_path=str(root / "config" / "outreach_templates.json")),
-                interview_client=interview,
-                contact_all_mode=True,
-                require_resume_before_final_verify=True,
-                interview_followup_delays_hours=[0.01, 0.01],
-            )
-
-            job_id = db.insert_job(
-                title="Senior Backend Engineer",
-                jd_text="Need Python, AWS and distributed systems.",
-                location="Remote",
-                preferred_languages=["en"],
-                seniority="senior",
-            )
-            profile = {
-                "linkedin_id": "ln-interview-1",
-                "full_name": "Candidate Interview",
-                "headline": "Backend Engineer",
-                "location": "Remote",
-                "languages": ["en"],
-                "skills": [],
-                "years_experience": 4,
-                "raw": {},
-            }
-            added = workflow.add_verified_candidates(
-                job_id=job_id,
-                verified_items=[{"profile": profile, "score": 0.72, "status": "needs_resume", "notes": {}}],
-            )
-            candidate_id = int(added["added"][0]["candidate_id"])
-            outreach = workflow.outreach_candidates(job_id=job_id, candidate_ids=[candidate_id])
-            conversation_id = int(outreach["conversation_ids"][0])
-
-            first = workflow.process_inbound_message(
-                conversation_id=conversation_id,
-                text="Sounds interesting, what is next",
-            )
-            self.assertEqual(first["mode"], "pre_resume")
-            self.assertEqual(first["intent"], "default")
-            self.assertFalse((first.get("interview") or {}).get("started"))
-
-            second = workflow.process_inbound_message(
-                conversation_id=conversation_id,
-                text="Here is my CV https://example.com/candidate-interview.pdf",
-            )
-            self.assertEqual(second["intent"], "resume_shared")
-            self.assertFalse((second.get("interview") or {}).get("started"))
-
-            third = workflow.process_inbound_message(
-                conversation_id=conversation_id,
-                text="I have 6 years of Python and AWS experience and I am targeting 150k USD.",
-            )
-            self.assertTrue((third.get("interview") or {}).get("started"))
-            self.assertTrue(str(third.get("reply") or "").startswith("Hey,"))
-            self.assertIn("interview.local", str(third.get("reply") or ""))
-
-            row = db.list_candidates_for_job(job_id)[0]
-            notes = row.get("verification_notes") if isinstance(row.get("verification_notes"), dict) else {}
-            self.assertEqual(row["status"], "interview_invited")
-            self.assertTrue(str((notes or {}).get("interview_session_id") or "").startswith("iv-"))
-            messages = db.list_messages(conversation_id)
-            resume_auto_replies = [
-                m
-                for m in messages
-                if (m.get("meta") or {}).get("type") == "pre_resume_auto_reply"
-                and (m.get("meta") or {}).get("intent") == "resume_shared"
-            ]
-            self.assertEqual(len(resume_auto_replies), 1)
-            self.assertTrue(str((notes or {}).get("interview_entry_url") or "").startswith("https://interview.local/"))
-
-            due_at = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
-            db.update_candidate_match_status(
-                job_id=job_id,
-                candidate_id=candidate_id,
-                status="interview_invited",
-                extra_notes={"interview_next_followup_at": due_at, "interview_followups_sent": 0, "interview_status": "invited"},
-            )
-            followup = workflow.run_due_interview_followups(job_id=job_id, limit=20)
-            self.assertEqual(followup["sent"], 1)
-
-            messages = db.list_messages(conversation_id)
-            types = {(m.get("meta") or {}).get("type") for m in messages}
-            self.assertIn("interview_invite", types)
-            self.assertIn("interview_followup", types)
-            pre_resume_opt_in = [
-                m
-                for m in messages
-                if (m.get("meta") or {}).get("type") == "pre_resume_auto_reply"
-                and (m.get("meta") or {}).get("intent") == "pre_vetting_opt_in"
-            ]
-            self.assertEqual(len(pre_resume_opt_in), 0)
-
-            session_id = str((notes or {}).get("interview_session_id") or "")
-            interview.sessions[session_id]["status"] = "scored"
-            interview.sessions[session_id]["summary"] = {"total_score": 82.5}
-            sync = workflow.sync_interview_progress(job_id=job_id, limit=20, force_refresh=False)
-            self.assertGreaterEqual(sync["updated"], 1)
-
-            row_after = db.list_candidates_for_job(job_id)[0]
-            notes_after = row_after.get("verification_notes") if isinstance(row_after.get("verification_notes"), dict) else {}
-            self.assertEqual(row_after["status"], "interview_passed")
-            self.assertAlmostEqual(float(notes_after.get("interview_total_score")), 82.5, places=2)
+        db = self._new_db()
+
+        provider = _LinkedInProvider()
+        interview = _InterviewClient()
+        workflow = WorkflowService(
+            db=db,
+            sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
+            verification_agent=VerificationAgent(self.matching),
+            outreach_agent=self.outreach_agent,
+            faq_agent=self.faq_agent,
+            pre_resume_service=PreResumeCommunicationService(templates_path=str(TEMPLATES_PATH)),
+            interview_client=interview,
+            contact_all_mode=True,
+            require_resume_before_final_verify=True,
+            interview_followup_delays_hours=[0.01, 0.01],
+        )
+
+        job_id = db.insert_job(
+            title="Senior Backend Engineer",
+            jd_text="Need Python, AWS and distributed systems.",
+            location="Remote",
+            preferred_languages=["en"],
+            seniority="senior",
+        )
+        profile = {
+            "linkedin_id": "ln-interview-1",
+            "full_name": "Candidate Interview",
+            "headline": "Backend Engineer",
+            "location": "Remote",
+            "languages": ["en"],
+            "skills": [],
+            "years_experience": 4,
+            "raw": {},
+        }
+        added = workflow.add_verified_candidates(
+            job_id=job_id,
+            verified_items=[{"profile": profile, "score": 0.72, "status": "needs_resume", "notes": {}}],
+        )
+        candidate_id = int(added["added"][0]["candidate_id"])
+        outreach = workflow.outreach_candidates(job_id=job_id, candidate_ids=[candidate_id])
+        conversation_id = int(outreach["conversation_ids"][0])
+
+        first = workflow.process_inbound_message(
+            conversation_id=conversation_id,
+            text="Sounds interesting, what is next",
+        )
+        self.assertEqual(first["mode"], "pre_resume")
+        self.assertEqual(first["intent"], "default")
+        self.assertFalse((first.get("interview") or {}).get("started"))
+
+        second = workflow.process_inbound_message(
+            conversation_id=conversation_id,
+            text="Here is my CV https://example.com/candidate-interview.pdf",
+        )
+        self.assertEqual(second["intent"], "resume_shared")
+        self.assertFalse((second.get("interview") or {}).get("started"))
+
+        third = workflow.process_inbound_message(
+            conversation_id=conversation_id,
+            text="I have 6 years of Python and AWS experience and I am targeting 150k USD.",
+        )
+        self.assertTrue((third.get("interview") or {}).get("started"))
+        self.assertTrue(str(third.get("reply") or "").startswith("Hey,"))
+        self.assertIn("interview.local", str(third.get("reply") or ""))
+
+        row = db.list_candidates_for_job(job_id)[0]
+        notes = row.get("verification_notes") if isinstance(row.get("verification_notes"), dict) else {}
+        self.assertEqual(row["status"], "interview_invited")
+        self.assertTrue(str((notes or {}).get("interview_session_id") or "").startswith("iv-"))
+        messages = db.list_messages(conversation_id)
+        resume_auto_replies = [
+            m
+            for m in messages
+            if (m.get("meta") or {}).get("type") == "pre_resume_auto_reply"
+            and (m.get("meta") or {}).get("intent") == "resume_shared"
+        ]
+        self.assertEqual(len(resume_auto_replies), 1)
+        self.assertTrue(str((notes or {}).get("interview_entry_url") or "").startswith("https://interview.local/"))
+
+        due_at = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        db.update_candidate_match_status(
+            job_id=job_id,
+            candidate_id=candidate_id,
+            status="interview_invited",
+            extra_notes={"interview_next_followup_at": due_at, "interview_followups_sent": 0, "interview_status": "invited"},
+        )
+        followup = workflow.run_due_interview_followups(job_id=job_id, limit=20)
+        self.assertEqual(followup["sent"], 1)
+
+        messages = db.list_messages(conversation_id)
+        types = {(m.get("meta") or {}).get("type") for m in messages}
+        self.assertIn("interview_invite", types)
+        self.assertIn("interview_followup", types)
+        pre_resume_opt_in = [
+            m
+            for m in messages
+            if (m.get("meta") or {}).get("type") == "pre_resume_auto_reply"
+            and (m.get("meta") or {}).get("intent") == "pre_vetting_opt_in"
+        ]
+        self.assertEqual(len(pre_resume_opt_in), 0)
+
+        session_id = str((notes or {}).get("interview_session_id") or "")
+        interview.sessions[session_id]["status"] = "scored"
+        interview.sessions[session_id]["summary"] = {"total_score": 82.5}
+        sync = workflow.sync_interview_progress(job_id=job_id, limit=20, force_refresh=False)
+        self.assertGreaterEqual(sync["updated"], 1)
+
+        row_after = db.list_candidates_for_job(job_id)[0]
+        notes_after = row_after.get("verification_notes") if isinstance(row_after.get("verification_notes"), dict) else {}
+        self.assertEqual(row_after["status"], "interview_passed")
+        self.assertAlmostEqual(float(notes_after.get("interview_total_score")), 82.5, places=2)
 
     def test_resume_plus_answers_trigger_interview_link(self) -> None:
-        root = Path(__file__).resolve().parents[1]
-        with TemporaryDirectory() as td:
-            db = Database(str(Path(td) / "interview_invite_resume.sqlite3"))
-            db.init_schema()
-
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
-            provider = _LinkedInProvider()
-            interview = _InterviewClient()
-            workflow = WorkflowService(
-                db=db,
-                sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
-                verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
-                pre_resume_service=PreResumeCommunicationService(templates_path=str(root / "config" / "outreach_templates.json")),
-                interview_client=interview,
-                contact_all_mode=True,
-                require_resume_before_final_verify=True,
-                interview_followup_delays_hours=[0.01, 0.01],
-            )
-
-            job_id = db.insert_job(
-                title="Senior Backend Engineer",
-                jd_text="Need Python, AWS and distributed systems.",
-                location="Remote",
-                preferred_languages=["en"],
-                seniority="senior",
-            )
-            profile = {
-                "linkedin_id": "ln-interview-2",
-                "full_name": "Candidate Resume",
-                "headline": "Backend Engineer",
-                "location": "Remote",
-                "languages": ["en"],
-                "skills": [],
-                "years_experience": 5,
-                "raw": {},
-            }
-            added = workflow.add_verified_candidates(
-                job_id=job_id,
-                verified_items=[{"profile": profile, "score": 0.72, "status": "needs_resume", "notes": {}}],
-            )
-            candidate_id = int(added["added"][0]["candidate_id"])
-            outreach = workflow.outreach_candidates(job_id=job_id, candidate_ids=[candidate_id])
-            conversation_id = int(outreach["conversation_ids"][0])
-
-            reply = workflow.process_inbound_message(
-                conversation_id=conversation_id,
-                text="Here is my CV https://example.com/candidate-resume.pdf",
-            )
-            self.assertEqual(reply["mode"], "pre_resume")
-            self.assertEqual(reply["intent"], "resume_shared")
-            self.assertFalse((reply.get("interview") or {}).get("started"))
-
-            completed = workflow.process_inbound_message(
-                conversation_id=conversation_id,
-                text="I have 5 years of Python and AWS experience and I am targeting 150k USD.",
-            )
-            self.assertTrue((completed.get("interview") or {}).get("started"))
-            self.assertTrue(str(completed.get("reply") or "").startswith("Hey,"))
-            self.assertIn("interview.local", str(completed.get("reply") or ""))
-
-            row = db.list_candidates_for_job(job_id)[0]
-            notes = row.get("verification_notes") if isinstance(row.get("verification_notes"), dict) else {}
-            self.assertEqual(row["status"], "interview_invited")
-            self.assertTrue(str((notes or {}).get("interview_session_id") or "").startswith("iv-"))
+        db = self._new_db()
+
+        provider = _LinkedInProvider()
+        interview = _InterviewClient()
+        workflow = WorkflowService(
+            db=db,
+            sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
+            verification_agent=VerificationAgent(self.matching),
+            outreach_agent=self.outreach_agent,
+            faq_agent=self.faq_agent,
+            pre_resume_service=PreResumeCommunicationService(templates_path=str(TEMPLATES_PATH)),
+            interview_client=interview,
+            contact_all_mode=True,
+            require_resume_before_final_verify=True,
+            interview_followup_delays_hours=[0.01, 0.01],
+        )
+
+        job_id = db.insert_job(
+            title="Senior Backend Engineer",
+            jd_text="Need Python, AWS and distributed systems.",
+            location="Remote",
+            preferred_languages=["en"],
+            seniority="senior",
+        )
+        profile = {
+            "linkedin_id": "ln-interview-2",
+            "full_name": "Candidate Resume",
+            "headline": "Backend Engineer",
+            "location": "Remote",
+            "languages": ["en"],
+            "skills": [],
+            "years_experience": 5,
+            "raw": {},
+        }
+        added = workflow.add_verified_candidates(
+            job_id=job_id,
+            verified_items=[{"profile": profile, "score": 0.72, "status": "needs_resume", "notes": {}}],
+        )
+        candidate_id = int(added["added"][0]["candidate_id"])
+        outreach = workflow.outreach_candidates(job_id=job_id, candidate_ids=[candidate_id])
+        conversation_id = int(outreach["conversation_ids"][0])
+
+        reply = workflow.process_inbound_message(
+            conversation_id=conversation_id,
+            text="Here is my CV https://example.com/candidate-resume.pdf",
+        )
+        self.assertEqual(reply["mode"], "pre_resume")
+        self.assertEqual(reply["intent"], "resume_shared")
+        self.assertFalse((reply.get("interview") or {}).get("started"))
+
+        completed = workflow.process_inbound_message(
+            conversation_id=conversation_id,
+            text="I have 5 years of Python and AWS experience and I am targeting 150k USD.",
+        )
+        self.assertTrue((completed.get("interview") or {}).get("started"))
+        self.assertTrue(str(completed.get("reply") or "").startswith("Hey,"))
+        self.assertIn("interview.local", str(completed.get("reply") or ""))
+
+        row = db.list_candidates_for_job(job_id)[0]
+        notes = row.get("verification_notes") if isinstance(row.get("verification_notes"), dict) else {}
+        self.assertEqual(row["status"], "interview_invited")
+        self.assertTrue(str((notes or {}).get("interview_session_id") or "").startswith("iv-"))
 
 
 if __name__ == "__main__":
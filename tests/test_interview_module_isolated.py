@@ -1,28 +1,26 @@
 from __future__ import annotations
 
-import hashlib
-import json
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from urllib.parse import urlparse
 
-from tener_interview.db import InterviewDatabase
+from tener_interview.db import InterviewDatabase, idempotency_payload_hash
 from tener_interview.providers import HireflixMockAdapter
 from tener_interview.scoring import InterviewScoringEngine
 from tener_interview.service import InterviewService
 from tener_interview.token_service import InterviewTokenService
 
+from tests.support import SchemaTemplateTestCase
+
 UTC = timezone.utc
 
 
-class InterviewModuleIsolatedTests(unittest.TestCase):
+class InterviewModuleIsolatedTests(SchemaTemplateTestCase):
+    database_class = InterviewDatabase
+
     def setUp(self) -> None:
-        self.tmp = TemporaryDirectory()
-        db_path = str(Path(self.tmp.name) / "interview.sqlite3")
-        self.db = InterviewDatabase(db_path=db_path)
-        self.db.init_schema()
+        self.db = self._new_db()
 
         self.provider = HireflixMockAdapter()
         self.token_service = InterviewTokenService(secret="unit-test-secret")
@@ -37,7 +35,7 @@ class InterviewModuleIsolatedTests(unittest.TestCase):
         )
 
     def tearDown(self) -> None:
-        self.tmp.cleanup()
+        self.db.close()
 
     def test_start_session_and_get_view(self) -> None:
         started = self.service.start_session(
@@ -96,7 +94,7 @@ class InterviewModuleIsolatedTests(unittest.TestCase):
 
     def test_idempotency_storage_contract(self) -> None:
         payload = {"job_id": 1, "candidate_id": 111}
-        payload_hash = hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+        payload_hash = idempotency_payload_hash(payload)
         response = {"session_id": "iv_1", "status": "invited"}
 
         self.db.put_idempotency_record(
@@ -67,7 +67,7 @@ class _Provider:
 class InterviewPrepareAssessmentTests(unittest.TestCase):
     def test_prepare_assessment_creates_once_and_reuses_cache(self) -> None:
         with TemporaryDirectory() as tmpdir:
-            db = InterviewDatabase(str(Path(tmpdir) / "interview.sqlite3"))
+            db = InterviewDatabase(":memory:")
             db.init_schema()
 
             guidelines_path = Path(tmpdir) / "guidelines.json"
@@ -349,6 +349,44 @@ class InterviewQuestionGenerationTests(unittest.TestCase):
             meta = out.get("meta") if isinstance(out.get("meta"), dict) else {}
             self.assertEqual(str(meta.get("role_family") or ""), "qa")
 
+    def test_repeat_generation_for_same_job_returns_independent_copies(self) -> None:
+        generator = InterviewQuestionGenerator(guidelines_path="", company_profile_path="", company_name="Acme Labs")
+        job = {"id": 7, "title": "Backend Engineer", "jd_text": "Python and AWS services."}
+
+        first = generator.generate_for_job(job)
+        first["questions"][0]["title"] = "mutated by caller"
+        second = generator.generate_for_job(dict(job))
+        self.assertEqual(second["generation_hash"], first["generation_hash"])
+        self.assertNotEqual(second["questions"][0]["title"], "mutated by caller")
+
+        changed = generator.generate_for_job({**job, "jd_text": "Java and Kubernetes platform work."})
+        self.assertNotEqual(changed["generation_hash"], first["generation_hash"])
+
+
+    def test_generators_do_not_share_loaded_guidelines_or_profile(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            guidelines_path = Path(tmpdir) / "guidelines.json"
+            profile_path = Path(tmpdir) / "company_profile.json"
+            guidelines_path.write_text(json.dumps({"defaults": {"category_targets": {"hard_skills": 0.5}}}), encoding="utf-8")
+            profile_path.write_text(json.dumps({"values": ["ownership"]}), encoding="utf-8")
+
+            first = InterviewQuestionGenerator(
+                guidelines_path=str(guidelines_path), company_profile_path=str(profile_path), company_name="Acme Labs"
+            )
+            second = InterviewQuestionGenerator(
+                guidelines_path=str(guidelines_path), company_profile_path=str(profile_path), company_name="Acme Labs"
+            )
+            first.guidelines["defaults"]["category_targets"]["hard_skills"] = 0.9
+            first.guidelines["skill_dictionary"].append("cobol")
+            first.company_profile["values"].append("speed")
+
+            self.assertEqual(second.guidelines["defaults"]["category_targets"]["hard_skills"], 0.5)
+            self.assertEqual(second.guidelines["defaults"]["category_targets"]["soft_skills"], 0.3)
+            self.assertNotIn("cobol", second.guidelines["skill_dictionary"])
+            self.assertEqual(second.company_profile["values"], ["ownership"])
+
+        fallback = InterviewQuestionGenerator(guidelines_path="", company_profile_path="", company_name="Acme Labs")
+        self.assertNotIn("cobol", fallback.guidelines["skill_dictionary"])
 
 if __name__ == "__main__":
     unittest.main()
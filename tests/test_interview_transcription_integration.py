@@ -74,7 +74,7 @@ class _TranscriptProvider:
 class InterviewTranscriptionIntegrationTests(unittest.TestCase):
     def test_refresh_uses_transcription_scoring(self) -> None:
         with TemporaryDirectory() as tmpdir:
-            db = InterviewDatabase(str(Path(tmpdir) / "interview.sqlite3"))
+            db = InterviewDatabase(":memory:")
             db.init_schema()
 
             criteria_path = Path(tmpdir) / "criteria.json"
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import threading
-import time
 import unittest
 from http.server import ThreadingHTTPServer
 from pathlib import Path
 from tempfile import TemporaryDirectory, gettempdir
 from typing import Any, Dict, Optional, Tuple
-from urllib import error, request
 
 os.environ.setdefault("TENER_DB_PATH", str(Path(gettempdir()) / "tener_job_culture_bootstrap.sqlite3"))
 
 from tener_ai import main as api_main
 from tener_ai.db import Database
 
+from tests.support import apply_fast_test_pragmas
+
 
 class _CultureService:
     def generate(self, company_name: str, website_url: str) -> Dict[str, Any]:
@@ -35,11 +36,34 @@ class _CultureService:
         }
 
 
+class _CultureReadyDatabase(Database):
+    def __init__(self, db_path: str) -> None:
+        super().__init__(db_path)
+        self.culture_ready = threading.Event()
+
+    def upsert_job_culture_profile(self, *, job_id: int, status: str, **kwargs: Any) -> None:
+        super().upsert_job_culture_profile(job_id=job_id, status=status, **kwargs)
+        if status == "ready":
+            self.culture_ready.set()
+
+
 class JobCreationCultureProfileTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), api_main.TenerRequestHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server_thread.join(timeout=3)
+
     def setUp(self) -> None:
         self._tmp = TemporaryDirectory()
         tmp_path = Path(self._tmp.name)
-        self.db = Database(str(tmp_path / "jobs_culture.sqlite3"))
+        self.db = apply_fast_test_pragmas(_CultureReadyDatabase(str(tmp_path / "jobs_culture.sqlite3")))
         self.db.init_schema()
         self._previous_services = api_main.SERVICES
         api_main.SERVICES = {
@@ -47,15 +71,10 @@ class JobCreationCultureProfileTests(unittest.TestCase):
             "company_culture": _CultureService(),
             "interview_api_base": "",
         }
-        self.server = ThreadingHTTPServer(("127.0.0.1", 0), api_main.TenerRequestHandler)
-        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
-        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
-        self.server_thread.start()
+        self.conn = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=20)
 
     def tearDown(self) -> None:
-        self.server.shutdown()
-        self.server.server_close()
-        self.server_thread.join(timeout=3)
+        self.conn.close()
         api_main.SERVICES = self._previous_services
         self._tmp.cleanup()
 
@@ -65,14 +84,10 @@ class JobCreationCultureProfileTests(unittest.TestCase):
         if payload is not None:
             headers["Content-Type"] = "application/json"
             data = json.dumps(payload).encode("utf-8")
-        req = request.Request(url=f"{self.base_url}{path}", method=method, data=data, headers=headers)
-        try:
-            with request.urlopen(req, timeout=20) as resp:
-                status = int(resp.status)
-                raw = resp.read().decode("utf-8")
-        except error.HTTPError as exc:
-            status = int(exc.code)
-            raw = exc.read().decode("utf-8")
+        self.conn.request(method, path, body=data, headers=headers)
+        resp = self.conn.getresponse()
+        status = int(resp.status)
+        raw = resp.read().decode("utf-8")
         if raw:
             try:
                 body = json.loads(raw)
@@ -115,13 +130,8 @@ class JobCreationCultureProfileTests(unittest.TestCase):
         self.assertGreater(job_id, 0)
         self.assertEqual(str((created.get("company_culture_profile") or {}).get("status") or ""), "pending")
 
-        deadline = time.time() + 3.0
-        profile = None
-        while time.time() < deadline:
-            profile = self.db.get_job_culture_profile(job_id)
-            if isinstance(profile, dict) and str(profile.get("status") or "") == "ready":
-                break
-            time.sleep(0.05)
+        self.assertTrue(self.db.culture_ready.wait(timeout=3.0))
+        profile = self.db.get_job_culture_profile(job_id)
         self.assertIsInstance(profile, dict)
         self.assertEqual(str((profile or {}).get("status") or ""), "ready")
 
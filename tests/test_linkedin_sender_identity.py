@@ -11,6 +11,8 @@ from tener_ai.db import Database
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _Provider:
     def search_profiles(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -31,7 +33,7 @@ class _Provider:
 
 class LinkedInSenderIdentityTests(unittest.TestCase):
     def test_followup_uses_linkedin_account_label_and_not_casey_default(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             previous = os.environ.get("TENER_LINKEDIN_RECRUITER_NAME")
             os.environ["TENER_LINKEDIN_RECRUITER_NAME"] = ""
@@ -11,6 +11,8 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _LLMStubProvider:
     def search_profiles(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -197,7 +199,7 @@ class _DashyLLMResponder(_FakeLLMResponder):
 
 class LLMReplyIntegrationTests(unittest.TestCase):
     def test_faq_reply_switches_llm_language_to_latest_candidate_message(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_faq_language.sqlite3"))
             db.init_schema()
@@ -249,7 +251,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertEqual(inbound_messages[-1]["candidate_language"], "es")
 
     def test_faq_reply_uses_llm_output(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_faq.sqlite3"))
             db.init_schema()
@@ -301,7 +303,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertIn("Python", llm.calls[-1]["jd_text"])
 
     def test_pre_resume_reply_uses_llm_output(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_pre.sqlite3"))
             db.init_schema()
@@ -354,7 +356,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertEqual(llm.calls[-1]["state_status"], "engaged_no_resume")
 
     def test_pre_resume_reply_switches_llm_language_to_latest_candidate_message(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_pre_language.sqlite3"))
             db.init_schema()
@@ -408,7 +410,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertEqual(inbound_messages[-1]["candidate_language"], "es")
 
     def test_pre_resume_extraction_ignores_attachment_noise_for_language_and_salary(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_pre_extraction_noise.sqlite3"))
             db.init_schema()
@@ -486,7 +488,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertEqual(inbound_messages[-1]["candidate_language"], "en")
 
     def test_pre_resume_llm_enforces_resume_cta_when_missing(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_pre_guard.sqlite3"))
             db.init_schema()
@@ -536,7 +538,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertIn("cv", reply["reply"].lower())
 
     def test_faq_llm_with_placeholders_falls_back_to_template(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_faq_guard.sqlite3"))
             db.init_schema()
@@ -583,7 +585,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertNotIn("{scope_summary}", reply["reply"])
 
     def test_initial_outreach_message_uses_llm_generation(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_outreach.sqlite3"))
             db.init_schema()
@@ -633,7 +635,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertTrue(any(call.get("mode") == "linkedin_outreach" for call in llm.calls))
 
     def test_pre_resume_followup_message_uses_llm_generation(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_followup.sqlite3"))
             db.init_schema()
@@ -705,7 +707,7 @@ class LLMReplyIntegrationTests(unittest.TestCase):
             self.assertTrue(any(call.get("mode") == "linkedin_followup" for call in llm.calls))
 
     def test_linkedin_outreach_and_followup_strip_dash_punctuation(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "llm_dash_guard.sqlite3"))
             db.init_schema()
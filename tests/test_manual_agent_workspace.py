@@ -9,6 +9,8 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _ManualWorkspaceProvider:
     def __init__(self) -> None:
@@ -78,7 +80,7 @@ class ManualAgentWorkspaceTests(unittest.TestCase):
         )
 
     def _seed_manual_conversation(self, llm_responder: Optional[Any] = None) -> tuple[Database, WorkflowService, int, int]:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         td = TemporaryDirectory()
         self.addCleanup(td.cleanup)
         db = Database(str(Path(td.name) / "manual_agent_workspace.sqlite3"))
@@ -100,7 +102,7 @@ class ManualAgentWorkspaceTests(unittest.TestCase):
         return db, workflow, int(added["conversation_id"]), int(added["candidate_id"])
 
     def test_manual_account_chat_flow_uses_manual_delivery(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "manual_agent_workspace.sqlite3"))
             db.init_schema()
@@ -1,14 +1,55 @@
+import json
+import os
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from tener_ai.matching import MatchingEngine
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class MatchingEngineTests(unittest.TestCase):
     def setUp(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         self.engine = MatchingEngine(str(root / "config" / "matching_rules.json"))
 
+    def test_reload_picks_up_edited_rules_file(self) -> None:
+        with TemporaryDirectory() as td:
+            rules_path = Path(td) / "rules.json"
+            rules_path.write_text(json.dumps({"skill_dictionary": ["python"]}), encoding="utf-8")
+            engine = MatchingEngine(str(rules_path))
+            self.assertEqual(engine.rules["skill_dictionary"], ["python"])
+
+            rules_path.write_text(json.dumps({"skill_dictionary": ["python", "rust"]}), encoding="utf-8")
+            job = {"title": "Backend Engineer", "jd_text": "Requirements:\n- Python\n- Rust"}
+            self.assertNotIn("rust", engine.build_job_requirements(job)["must_have_skills"])
+            engine.reload()
+            self.assertEqual(engine.rules["skill_dictionary"], ["python", "rust"])
+            self.assertIn("rust", engine.build_job_requirements(job)["must_have_skills"])
+
+    def test_reload_picks_up_same_size_edit_within_one_mtime_tick(self) -> None:
+        with TemporaryDirectory() as td:
+            rules_path = Path(td) / "rules.json"
+            rules_path.write_text(json.dumps({"skill_dictionary": ["python"]}), encoding="utf-8")
+            before = os.stat(rules_path)
+            engine = MatchingEngine(str(rules_path))
+
+            rules_path.write_text(json.dumps({"skill_dictionary": ["golang"]}), encoding="utf-8")
+            os.utime(rules_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+            self.assertEqual(os.stat(rules_path).st_size, before.st_size)
+
+            engine.reload()
+            self.assertEqual(engine.rules["skill_dictionary"], ["golang"])
+
+    def test_engines_over_the_same_file_do_not_share_rules(self) -> None:
+        rules_path = REPO_ROOT / "config" / "matching_rules.json"
+        first = MatchingEngine(str(rules_path))
+        second = MatchingEngine(str(rules_path))
+        self.assertIsNot(first.rules, second.rules)
+        first.rules["skill_dictionary"].append("cobol")
+        self.assertNotIn("cobol", second.rules["skill_dictionary"])
+
     def test_verifies_relevant_candidate(self) -> None:
         job = {
             "title": "Senior Backend Engineer",
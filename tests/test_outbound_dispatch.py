@@ -12,6 +12,8 @@ from tener_ai.db import Database
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _NoopProvider:
     def search_profiles(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -122,7 +124,7 @@ class OutboundDispatchTests(unittest.TestCase):
         managed_linkedin_dispatch_inline: bool,
         linkedin_outreach_policy: Dict[str, Any] | None = None,
     ) -> WorkflowService:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
         return WorkflowService(
             db=db,
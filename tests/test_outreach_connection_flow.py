@@ -10,6 +10,8 @@ from tener_ai.db import Database
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _ConnectionAwareProvider:
     def __init__(self) -> None:
@@ -47,7 +49,7 @@ class _ConnectionAwareProvider:
 
 class OutreachConnectionFlowTests(unittest.TestCase):
     def test_outreach_queues_message_until_connection_is_accepted(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "outreach_connection.sqlite3"))
             db.init_schema()
@@ -118,7 +120,7 @@ class OutreachConnectionFlowTests(unittest.TestCase):
             self.assertTrue((last_outbound.get("meta") or {}).get("delivery", {}).get("sent"))
 
     def test_send_after_connection_reasserts_match_status_when_connection_is_still_required(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "outreach_connection.sqlite3"))
             db.init_schema()
@@ -176,7 +178,7 @@ class OutreachConnectionFlowTests(unittest.TestCase):
             self.assertEqual(str((match or {}).get("status") or ""), "outreach_pending_connection")
 
     def test_reconcile_waiting_connection_match_statuses_dry_run_does_not_mutate_match(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "outreach_reconcile.sqlite3"))
             db.init_schema()
@@ -233,7 +235,7 @@ class OutreachConnectionFlowTests(unittest.TestCase):
             self.assertEqual(str((match or {}).get("status") or ""), "needs_resume")
 
     def test_reconcile_waiting_connection_match_statuses_updates_stale_match_status(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "outreach_reconcile.sqlite3"))
             db.init_schema()
@@ -11,6 +11,8 @@ from tener_ai.db import Database
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _ConnectionAwareProvider:
     def __init__(self) -> None:
@@ -44,7 +46,7 @@ class _ConnectionAwareProvider:
 
 class OutreachSchedulerTests(unittest.TestCase):
     def test_connection_poll_scheduler_tick_advances_waiting_connection_conversations(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "outreach_scheduler.sqlite3"))
             db.init_schema()
@@ -111,7 +113,7 @@ class OutreachSchedulerTests(unittest.TestCase):
                 api_main.SERVICES = previous_services
 
     def test_connection_poll_scheduler_skips_paused_jobs(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "outreach_scheduler_paused.sqlite3"))
             db.init_schema()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import unittest
+import uuid
+from pathlib import Path
+
+from tener_ai.db_pg import PostgresMigrationRunner
+from tener_ai.db_runtime_pg import PostgresRuntimeDatabase
+
+
+class PostgresWebhookEventsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.root = Path(__file__).resolve().parents[1]
+        cls.dsn = str(os.environ.get("TENER_TEST_POSTGRES_DSN", "") or "").strip()
+        if not cls.dsn:
+            raise unittest.SkipTest("TENER_TEST_POSTGRES_DSN is not set")
+        try:
+            import psycopg  # noqa: F401
+        except Exception as exc:  # pragma: no cover
+            raise unittest.SkipTest(f"psycopg is unavailable: {exc}")
+        out = PostgresMigrationRunner(dsn=cls.dsn, migrations_dir=str(cls.root / "migrations")).apply_all()
+        if out.get("status") != "ok":
+            raise AssertionError(f"postgres migrations failed: {out}")
+        cls.db = PostgresRuntimeDatabase(cls.dsn)
+
+    def _key(self, name: str) -> str:
+        return f"pg-webhook-test:{self.id()}:{name}:{uuid.uuid4().hex}"
+
+    def test_record_webhook_events_returns_only_new_keys(self) -> None:
+        seen, fresh, other = self._key("seen"), self._key("fresh"), self._key("other")
+        self.assertTrue(self.db.record_webhook_event(event_key=seen, source="unipile_poll", payload={"n": 0}))
+
+        new_keys = self.db.record_webhook_events(
+            [
+                (seen, "unipile_poll", {"n": 0}),
+                (fresh, "unipile_poll", {"n": 1}),
+                (other, "unipile_poll", None),
+                (fresh, "unipile_poll", {"n": 1}),
+            ]
+        )
+        self.assertEqual(new_keys, {fresh, other})
+        self.assertEqual(self.db.record_webhook_events([(fresh, "unipile_poll", {"n": 1})]), set())
+        self.assertEqual(self.db.record_webhook_events([]), set())
+
+    def test_forget_webhook_events_lets_keys_be_recorded_again(self) -> None:
+        kept, dropped = self._key("kept"), self._key("dropped")
+        self.assertEqual(
+            self.db.record_webhook_events([(kept, "unipile_poll", {}), (dropped, "unipile_poll", {})]),
+            {kept, dropped},
+        )
+
+        self.db.forget_webhook_events([dropped])
+        self.db.forget_webhook_events([])
+
+        self.assertEqual(
+            self.db.record_webhook_events([(kept, "unipile_poll", {}), (dropped, "unipile_poll", {})]),
+            {dropped},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
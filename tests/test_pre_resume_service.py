@@ -3,8 +3,12 @@ import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from tener_ai.agents import FAQAgent, OutreachAgent
+from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class PreResumeServiceTests(unittest.TestCase):
     def _start_default_session(self, service: PreResumeCommunicationService) -> None:
@@ -27,6 +31,25 @@ class PreResumeServiceTests(unittest.TestCase):
         self.assertIn("async interview", out["outbound"])
         self.assertTrue(out["state"]["next_followup_at"])
 
+    def test_template_loaders_do_not_share_parsed_templates_between_instances(self) -> None:
+        templates_path = str(REPO_ROOT / "config" / "outreach_templates.json")
+        matching = MatchingEngine(str(REPO_ROOT / "config" / "matching_rules.json"))
+        outreach = OutreachAgent(templates_path, matching)
+        faq = FAQAgent(templates_path, matching)
+        first = PreResumeCommunicationService(templates_path=templates_path)
+        second = PreResumeCommunicationService(templates_path=templates_path)
+
+        self.assertIsNot(outreach.templates, faq.templates)
+        outreach.templates["default_language"] = "xx"
+        self.assertNotEqual(faq.templates.get("default_language"), "xx")
+        self.assertNotEqual(OutreachAgent(templates_path, matching).templates.get("default_language"), "xx")
+
+        first.templates["marker"] = "mutated"
+        self.assertNotIn("marker", second.templates)
+        for key, value in first.templates.items():
+            if isinstance(value, (dict, list)):
+                self.assertIsNot(value, second.templates.get(key))
+
     def test_salary_answer_can_arrive_before_other_answers(self) -> None:
         service = PreResumeCommunicationService()
         self._start_default_session(service)
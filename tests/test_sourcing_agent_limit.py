@@ -8,6 +8,8 @@ from typing import Any, Dict, List
 from tener_ai.agents import SourcingAgent
 from tener_ai.matching import MatchingEngine
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _DuplicateHeavyProvider:
     def search_profiles(self, query: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
@@ -174,7 +176,7 @@ class _WideStructuredProvider:
 class SourcingAgentLimitTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         cls.matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
 
     def test_find_candidates_can_reach_high_limit_with_duplicate_heavy_provider(self) -> None:
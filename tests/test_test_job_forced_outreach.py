@@ -11,6 +11,7 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
 FORCED_TEST_ID = "olena-bachek-b8523121a"
 FORCED_PROVIDER_ID = "ACoAADc0-FUBAMKDmKggoixvfVaLiocMh19_JDU"
 
@@ -56,21 +57,20 @@ class _SourceProvider(_Provider):
 
 class TestJobForcedOutreachTests(unittest.TestCase):
     def test_manual_qa_job_does_not_auto_enable_forced_only_mode(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "manual_qa_not_test_job.sqlite3"))
             db.init_schema()
             ids_file = Path(td) / "forced_ids.txt"
             ids_file.write_text(f"{FORCED_TEST_ID}\n", encoding="utf-8")
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
+            matching = MatchingEngine(str(REPO_ROOT / "config" / "matching_rules.json"))
             provider = _SourceProvider()
             workflow = WorkflowService(
                 db=db,
                 sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
                 verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
+                outreach_agent=OutreachAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
+                faq_agent=FAQAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
                 forced_test_ids_path=str(ids_file),
             )
 
@@ -90,21 +90,20 @@ class TestJobForcedOutreachTests(unittest.TestCase):
             self.assertIn("regular-manual-qa", ids)
 
     def test_test_job_outreach_sends_only_to_forced_candidates(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "test_job_forced.sqlite3"))
             db.init_schema()
             ids_file = Path(td) / "forced_ids.txt"
             ids_file.write_text(f"{FORCED_TEST_ID}\n", encoding="utf-8")
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
+            matching = MatchingEngine(str(REPO_ROOT / "config" / "matching_rules.json"))
             provider = _Provider()
             workflow = WorkflowService(
                 db=db,
                 sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
                 verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
+                outreach_agent=OutreachAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
+                faq_agent=FAQAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
                 forced_test_ids_path=str(ids_file),
             )
 
@@ -163,21 +162,20 @@ class TestJobForcedOutreachTests(unittest.TestCase):
             self.assertEqual([item.get("candidate_id") for item in (out.get("items") or [])], [added["added"][0]["candidate_id"]])
 
     def test_production_job_excludes_forced_candidates_when_test_mode_is_off(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "test_job_forced_off.sqlite3"))
             db.init_schema()
             ids_file = Path(td) / "forced_ids.txt"
             ids_file.write_text(f"{FORCED_TEST_ID}\n", encoding="utf-8")
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
+            matching = MatchingEngine(str(REPO_ROOT / "config" / "matching_rules.json"))
             provider = _Provider()
             workflow = WorkflowService(
                 db=db,
                 sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
                 verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
+                outreach_agent=OutreachAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
+                faq_agent=FAQAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
                 forced_test_ids_path=str(ids_file),
             )
 
@@ -236,22 +234,21 @@ class TestJobForcedOutreachTests(unittest.TestCase):
             self.assertEqual([item.get("candidate_id") for item in (out.get("items") or [])], [added["added"][1]["candidate_id"]])
 
     def test_pre_resume_followup_skips_non_forced_candidate_for_test_job(self) -> None:
-        root = Path(__file__).resolve().parents[1]
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "test_job_forced_followup.sqlite3"))
             db.init_schema()
             ids_file = Path(td) / "forced_ids.txt"
             ids_file.write_text(f"{FORCED_TEST_ID}\n", encoding="utf-8")
 
-            matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
+            matching = MatchingEngine(str(REPO_ROOT / "config" / "matching_rules.json"))
             provider = _Provider()
-            pre_resume = PreResumeCommunicationService(templates_path=str(root / "config" / "outreach_templates.json"))
+            pre_resume = PreResumeCommunicationService(templates_path=str(REPO_ROOT / "config" / "outreach_templates.json"))
             workflow = WorkflowService(
                 db=db,
                 sourcing_agent=SourcingAgent(provider),  # type: ignore[arg-type]
                 verification_agent=VerificationAgent(matching),
-                outreach_agent=OutreachAgent(str(root / "config" / "outreach_templates.json"), matching),
-                faq_agent=FAQAgent(str(root / "config" / "outreach_templates.json"), matching),
+                outreach_agent=OutreachAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
+                faq_agent=FAQAgent(str(REPO_ROOT / "config" / "outreach_templates.json"), matching),
                 pre_resume_service=pre_resume,
                 forced_test_ids_path=str(ids_file),
             )
@@ -9,6 +9,8 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _WebhookStubProvider:
     def enrich_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -38,7 +40,7 @@ class _WebhookStubProvider:
 
 class WebhookInboundRoutingTests(unittest.TestCase):
     def test_process_provider_inbound_routes_by_chat_id_and_updates_status(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "webhook_route.sqlite3"))
             db.init_schema()
@@ -8,6 +8,8 @@ from tener_ai.db import Database
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _StubLinkedInProvider:
     def enrich_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -19,7 +21,7 @@ class _StubLinkedInProvider:
 
 class WorkflowContactAllTests(unittest.TestCase):
     def test_contact_all_mode_converts_reject_to_needs_resume_and_requests_cv(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_contact_all.sqlite3"))
             db.init_schema()
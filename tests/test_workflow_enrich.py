@@ -8,6 +8,8 @@ from tener_ai.db import Database
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _FakeProvider:
     def search_profiles(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -29,7 +31,7 @@ class _FakeProvider:
 
 class WorkflowEnrichTests(unittest.TestCase):
     def test_verify_uses_enriched_profiles(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "db.sqlite3"))
             db.init_schema()
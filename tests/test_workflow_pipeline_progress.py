@@ -10,6 +10,8 @@ from tener_ai.db import Database, utc_now_iso
 from tener_ai.matching import MatchingEngine
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _AccountAwareProvider:
     def __init__(self) -> None:
@@ -214,7 +216,7 @@ class _TopUpProvider:
 
 class WorkflowPipelineProgressTests(unittest.TestCase):
     def _build_workflow(self, work_dir: Path, provider: Any) -> Tuple[Database, WorkflowService]:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         db = Database(str(work_dir / "workflow_pipeline_progress.sqlite3"))
         db.init_schema()
         matching = MatchingEngine(str(root / "config" / "matching_rules.json"))
@@ -10,6 +10,8 @@ from tener_ai.matching import MatchingEngine
 from tener_ai.pre_resume_service import PreResumeCommunicationService
 from tener_ai.workflow import WorkflowService
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class _FollowupChatProvider:
     def __init__(self) -> None:
@@ -45,7 +47,7 @@ class _FailingSecondFollowupProvider:
 
 class WorkflowPreResumeIntegrationTests(unittest.TestCase):
     def test_first_inbound_marks_candidate_in_dialogue(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_pre_resume_dialogue.sqlite3"))
             db.init_schema()
@@ -96,7 +98,7 @@ class WorkflowPreResumeIntegrationTests(unittest.TestCase):
             self.assertEqual(match_rows[0]["status"], "in_dialogue")
 
     def test_prescreen_first_chat_flow_until_ready_for_interview(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_pre_resume.sqlite3"))
             db.init_schema()
@@ -187,7 +189,7 @@ class WorkflowPreResumeIntegrationTests(unittest.TestCase):
             self.assertIn("inbound_processed", event_types)
 
     def test_followup_exhaustion_marks_candidate_stalled(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_pre_resume_stalled.sqlite3"))
             db.init_schema()
@@ -257,7 +259,7 @@ class WorkflowPreResumeIntegrationTests(unittest.TestCase):
             self.assertEqual(match_rows[0]["status"], "stalled")
 
     def test_followup_binds_external_chat_id_from_delivery(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_pre_resume_followup_binding.sqlite3"))
             db.init_schema()
@@ -328,7 +330,7 @@ class WorkflowPreResumeIntegrationTests(unittest.TestCase):
             self.assertEqual(last_meta.get("external_chat_id"), "chat-followup-1")
 
     def test_pre_resume_followup_keeps_latest_candidate_language(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_pre_resume_language.sqlite3"))
             db.init_schema()
@@ -398,7 +400,7 @@ class WorkflowPreResumeIntegrationTests(unittest.TestCase):
             self.assertIn("Seguimiento", last_outbound["content"])
 
     def test_followup_delivery_failure_does_not_promote_communication_to_dialogue(self) -> None:
-        root = Path(__file__).resolve().parents[1]
+        root = REPO_ROOT
         with TemporaryDirectory() as td:
             db = Database(str(Path(td) / "workflow_pre_resume_followup_failure.sqlite3"))
             db.init_schema()